@@ -0,0 +1,284 @@
+# scripts/benchmark.py
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config_p3 import (
+    ROOT,
+    N_POCOS, N_MUCHOS,
+    W_MIN, W_MAX,
+    MODELOS,
+    build_base_graph,
+)
+from grafo_dijkstra import GrafoDijkstra
+from estadisticas_dijkstra import EstadisticasDijkstra
+from pipeline import choose_source_id
+from export_gv_pesos import export_graphviz
+
+
+TAMANOS_DEFAULT = [N_POCOS, N_MUCHOS, 10_000, 100_000]
+SEEDS_DEFAULT = [1, 2, 3]
+TOLERANCIA_DEFAULT = 0.20  # 20% más lento / más memoria = regresión...
+PISO_TIEMPO_S = 0.005  # ...y además al menos esto más lento (ruido del reloj)
+PISO_MEMORIA_BYTES = 64 * 1024
+REPETICIONES_DEFAULT = 5
+# a partir de este n se usan los generadores compactos (generadores_rapidos):
+# los de P1 crean un objeto por nodo/arista y no escalan a 10^5-10^6
+COMPACTO_DESDE = 20_000
+
+
+def _medir(fn: Callable[[], Any], memoria: bool, repeticiones: int = 1) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Corre fn `repeticiones` veces y regresa (último resultado, medidas):
+    - tiempo_s: mínimo de las corridas (lo menos afectado por ruido)
+    - tiempo_mediana_s
+    - memoria_pico_bytes: pico con tracemalloc en una corrida extra (o None)
+    El tiempo se mide sin tracemalloc; fn debe poder repetirse.
+    """
+    tiempos = []
+    for _ in range(max(1, repeticiones)):
+        t0 = time.perf_counter()
+        res = fn()
+        tiempos.append(time.perf_counter() - t0)
+
+    pico = None
+    if memoria:
+        tracemalloc.start()
+        fn()
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return res, {
+        "tiempo_s": min(tiempos),
+        "tiempo_mediana_s": statistics.median(tiempos),
+        "memoria_pico_bytes": pico,
+    }
+
+
+def correr_caso(
+    modelo: str,
+    n: int,
+    seed: int,
+    memoria: bool = True,
+    repeticiones: int = REPETICIONES_DEFAULT,
+    compacto: Optional[bool] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Mide las fases de un (modelo, n, seed) y regresa un registro por fase.
+    compacto=None decide por n (COMPACTO_DESDE).
+    """
+    if compacto is None:
+        compacto = n >= COMPACTO_DESDE
+    if compacto:
+        return _caso_compacto(modelo, n, seed, memoria, repeticiones)
+
+    registros = []
+
+    def registro(fase, medidas, **extra):
+        r = {"modelo": modelo, "n": n, "seed": seed, "fase": fase}
+        r.update(medidas)
+        r.update(extra)
+        registros.append(r)
+
+    def construir():
+        return GrafoDijkstra.from_grafo(build_base_graph(modelo, n, seed))
+
+    g, med = _medir(construir, memoria, repeticiones)
+    n_real, m = len(g.nodos()), len(g.aristas())
+    registro("construccion", med, n_real=n_real, m=m)
+
+    _, med = _medir(lambda: g.asignar_pesos_uniformes(W_MIN, W_MAX, seed=seed), memoria, repeticiones)
+    registro("pesos", med, n_real=n_real, m=m)
+
+    s = choose_source_id(g)
+    _, med = _medir(lambda: g.Dijkstra(s), memoria, repeticiones)
+    # contadores del ciclo en una corrida aparte (la medida de tiempo va sin instrumentar)
+    stats = g.Dijkstra(s, stats=EstadisticasDijkstra()).stats
+    t = med["tiempo_s"]
+    registro("dijkstra", med, n_real=n_real, m=m,
+             asentados_por_s=stats.asentados / t if t > 0 else None, **stats.como_dict())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "bench.gv")
+        _, med = _medir(lambda: export_graphviz(g, path, peso_fn=g.peso_arista), memoria, repeticiones)
+    registro("export", med, n_real=n_real, m=m)
+
+    return registros
+
+
+# contadores que GrafoCSR.dijkstra no lleva (el ciclo no está instrumentado)
+CONTADORES_FALTANTES_CSR = ("pushes", "pops", "pops_obsoletos", "relajaciones", "cola_max")
+
+
+def _contadores_csr(g, dist) -> Dict[str, Any]:
+    """
+    Contadores que se pueden reconstruir del resultado: asentados (dist
+    finita) y aristas_examinadas (grado de cada asentado). El resto queda
+    en None y se lista en contadores_faltantes.
+    """
+    d = np.asarray(dist, dtype=np.float64)
+    asentado = np.isfinite(d)
+    grado = np.diff(np.asarray(g.offsets, dtype=np.int64))
+    res: Dict[str, Any] = {k: None for k in CONTADORES_FALTANTES_CSR}
+    res["asentados"] = int(asentado.sum())
+    res["aristas_examinadas"] = int(grado[asentado].sum())
+    res["contadores_faltantes"] = list(CONTADORES_FALTANTES_CSR)
+    return res
+
+
+def _caso_compacto(modelo: str, n: int, seed: int, memoria: bool, repeticiones: int) -> List[Dict[str, Any]]:
+    """
+    Camino para n grandes (generadores_rapidos, sin objetos del P1):
+    - construccion: aristas del modelo como arreglos
+    - pesos: pesos uniformes [W_MIN, W_MAX]
+    - compilacion: ensamblado del GrafoCSR
+    - dijkstra: GrafoCSR.dijkstra (contadores parciales, ver _contadores_csr)
+    - export: save_binary (.gdb); el .gv de 10^5-10^6 nodos no es un caso de uso
+    """
+    from generadores_rapidos import aristas_compactas, csr_desde_arreglos, pesos_compactos
+
+    registros = []
+
+    def registro(fase, medidas, **extra):
+        r = {"modelo": modelo, "n": n, "seed": seed, "fase": fase, "compacto": True}
+        r.update(medidas)
+        r.update(extra)
+        registros.append(r)
+
+    (ids, u, v, xs, ys), med = _medir(lambda: aristas_compactas(modelo, n, seed), memoria, repeticiones)
+    n_real, m = len(ids), len(u)
+    registro("construccion", med, n_real=n_real, m=m)
+
+    w, med = _medir(lambda: pesos_compactos(m, seed), memoria, repeticiones)
+    registro("pesos", med, n_real=n_real, m=m)
+
+    g, med = _medir(lambda: csr_desde_arreglos(ids, u, v, w, xs, ys), memoria, repeticiones)
+    registro("compilacion", med, n_real=n_real, m=m)
+
+    s = g.ids[0]  # igual que choose_source_id: el primer nodo
+    (dist, _), med = _medir(lambda: g.dijkstra(s), memoria, repeticiones)
+    contadores = _contadores_csr(g, dist)
+    t = med["tiempo_s"]
+    registro("dijkstra", med, n_real=n_real, m=m,
+             asentados_por_s=contadores["asentados"] / t if t > 0 else None, **contadores)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "bench.gdb")
+        _, med = _medir(lambda: g.save_binary(path), memoria, repeticiones)
+    registro("export", med, n_real=n_real, m=m, formato="gdb")
+
+    return registros
+
+
+def correr(
+    modelos: List[str],
+    tamanos: List[int],
+    seeds: List[int],
+    memoria: bool = True,
+    repeticiones: int = REPETICIONES_DEFAULT,
+    compacto: Optional[bool] = None,
+) -> Dict[str, Any]:
+    registros = []
+    for modelo in modelos:
+        for n in tamanos:
+            for seed in seeds:
+                regs = correr_caso(modelo, n, seed, memoria=memoria, repeticiones=repeticiones, compacto=compacto)
+                registros.extend(regs)
+                tiempos = "  ".join(f"{r['fase']}={r['tiempo_s']:.4f}s" for r in regs)
+                print(f"[OK] {modelo} n={n} seed={seed}  {tiempos}")
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "plataforma": platform.platform(),
+            "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeticiones": repeticiones,
+            # registros con compacto=True: ver _caso_compacto (fases y contadores)
+            "compacto_desde": COMPACTO_DESDE if compacto is None else (0 if compacto else None),
+        },
+        "registros": registros,
+    }
+
+
+def _llave(r: Dict[str, Any]) -> Tuple:
+    return (r["modelo"], r["n"], r["seed"], r["fase"])
+
+
+def comparar(
+    actual: Dict[str, Any],
+    base: Dict[str, Any],
+    tolerancia: float,
+    piso_tiempo: float = PISO_TIEMPO_S,
+    piso_memoria: int = PISO_MEMORIA_BYTES,
+) -> List[str]:
+    """
+    Compara contra una línea base y regresa la lista de regresiones:
+    tiempo (mínimo de las repeticiones) o memoria pico por encima de
+    base * (1 + tolerancia) y, además, por encima de base + piso
+    (en fases de milisegundos un 20% es puro ruido).
+    """
+    previos = {_llave(r): r for r in base["registros"]}
+    pisos = {"tiempo_s": piso_tiempo, "memoria_pico_bytes": piso_memoria}
+    regresiones = []
+    for r in actual["registros"]:
+        b = previos.get(_llave(r))
+        if b is None:
+            continue
+        for campo, piso in pisos.items():
+            va, vb = r.get(campo), b.get(campo)
+            if va is None or vb is None or vb <= 0:
+                continue
+            if va > vb * (1 + tolerancia) and va - vb > piso:
+                regresiones.append(
+                    f"{r['modelo']} n={r['n']} seed={r['seed']} {r['fase']}: "
+                    f"{campo} {vb:.4g} -> {va:.4g} (+{100 * (va / vb - 1):.0f}%)"
+                )
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de GrafoDijkstra por modelo y tamaño.")
+    parser.add_argument("--modelos", nargs="+", default=MODELOS)
+    parser.add_argument("--tamanos", nargs="+", type=int, default=TAMANOS_DEFAULT)
+    parser.add_argument("--seeds", nargs="+", type=int, default=SEEDS_DEFAULT)
+    parser.add_argument("--salida", default=str(ROOT / "outputs" / "bench" / "bench.json"))
+    parser.add_argument("--sin-memoria", action="store_true", help="no mide memoria pico (más rápido)")
+    parser.add_argument("--comparar", default=None, help="JSON de línea base para detectar regresiones")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA_DEFAULT)
+    parser.add_argument("--piso-tiempo", type=float, default=PISO_TIEMPO_S,
+                        help="diferencia mínima en segundos para contar una regresión de tiempo")
+    parser.add_argument("--repeticiones", type=int, default=REPETICIONES_DEFAULT,
+                        help="corridas por fase (se reporta el mínimo y la mediana)")
+    parser.add_argument("--compacto", action=argparse.BooleanOptionalAction, default=None,
+                        help=f"generadores compactos (default: sólo con n >= {COMPACTO_DESDE})")
+    args = parser.parse_args()
+
+    resultado = correr(args.modelos, args.tamanos, args.seeds, memoria=not args.sin_memoria,
+                       repeticiones=args.repeticiones, compacto=args.compacto)
+
+    salida = Path(args.salida)
+    salida.parent.mkdir(parents=True, exist_ok=True)
+    salida.write_text(json.dumps(resultado, indent=2), encoding="utf-8")
+    print(f"Resultados: {salida}")
+
+    if args.comparar:
+        base = json.loads(Path(args.comparar).read_text(encoding="utf-8"))
+        regresiones = comparar(resultado, base, args.tolerancia, piso_tiempo=args.piso_tiempo)
+        for r in regresiones:
+            print(f"[REGRESION] {r}")
+        if regresiones:
+            sys.exit(1)
+        print("Sin regresiones.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# scripts/cache_dijkstra.py
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+def tamano_resultado(res) -> int:
+    """
+    Estimación (bytes) de un ResultadoSPT: los dos dicts más un float
+    por entrada de dist. Basta para respetar un presupuesto aproximado.
+    """
+    return sys.getsizeof(res.dist) + sys.getsizeof(res.parent) + 24 * len(res.dist)
+
+
+class CacheLRU:
+    """
+    Cache LRU con presupuesto por número de entradas y/o bytes estimados.
+    - get(k) / put(k, v): put desaloja lo menos usado hasta caber
+    - descartar(pred): elimina las llaves que cumplan pred (p. ej. versiones viejas)
+    - estadisticas(): hits, misses, desalojos, entradas, bytes
+    """
+
+    def __init__(
+        self,
+        max_entradas: Optional[int] = 128,
+        max_bytes: Optional[int] = None,
+        tamano: Callable[[Any], int] = tamano_resultado,
+    ):
+        if max_entradas is None and max_bytes is None:
+            raise ValueError("CacheLRU requiere max_entradas o max_bytes")
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self._tamano = tamano
+        self._datos: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._bytes: Dict[Hashable, int] = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.desalojos = 0
+
+    def __len__(self):
+        return len(self._datos)
+
+    def __contains__(self, k):
+        return k in self._datos
+
+    def get(self, k):
+        if k in self._datos:
+            self._datos.move_to_end(k)
+            self.hits += 1
+            return self._datos[k]
+        self.misses += 1
+        return None
+
+    def put(self, k, v):
+        if k in self._datos:
+            self._quitar(k)
+        b = self._tamano(v) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and b > self.max_bytes:
+            return  # no cabe ni sola: no se guarda
+        self._datos[k] = v
+        self._bytes[k] = b
+        self.bytes += b
+        while self._excede():
+            viejo = next(iter(self._datos))
+            self._quitar(viejo)
+            self.desalojos += 1
+
+    def descartar(self, pred: Callable[[Hashable], bool]):
+        for k in [k for k in self._datos if pred(k)]:
+            self._quitar(k)
+
+    def limpiar(self):
+        self._datos.clear()
+        self._bytes.clear()
+        self.bytes = 0
+
+    def estadisticas(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "desalojos": self.desalojos,
+            "entradas": len(self._datos),
+            "bytes": self.bytes,
+        }
+
+    def _excede(self) -> bool:
+        if self.max_entradas is not None and len(self._datos) > self.max_entradas:
+            return True
+        return self.max_bytes is not None and self.bytes > self.max_bytes
+
+    def _quitar(self, k):
+        del self._datos[k]
+        self.bytes -= self._bytes.pop(k)
@@ -0,0 +1,107 @@
+# scripts/colas.py
+from __future__ import annotations
+
+import heapq
+from typing import Any, List, Tuple
+
+
+class ColaBinaria:
+    """Heap binario (heapq) con borrado perezoso: es la cola por defecto."""
+
+    __slots__ = ("_heap",)
+
+    def __init__(self):
+        self._heap: List[Tuple[Any, Any]] = []
+
+    def push(self, k, x):
+        heapq.heappush(self._heap, (k, x))
+
+    def pop(self) -> Tuple[Any, Any]:
+        return heapq.heappop(self._heap)
+
+    def __len__(self):
+        return len(self._heap)
+
+
+class ColaDial:
+    """
+    Cola de cubetas de Dial para claves enteras monótonas.
+    - c_max: peso entero máximo de una arista
+    Usa c_max + 1 cubetas circulares: todas las claves vivas están en
+    [actual, actual + c_max], así que cada cubeta guarda una sola clave.
+    push y pop son O(1) amortizado (pop recorre a lo más c_max cubetas).
+    """
+
+    __slots__ = ("_cubetas", "_nb", "_actual", "_n")
+
+    def __init__(self, c_max: int):
+        if c_max < 1:
+            raise ValueError("ColaDial requiere c_max >= 1")
+        self._nb = c_max + 1
+        self._cubetas: List[List[Any]] = [[] for _ in range(self._nb)]
+        self._actual = 0
+        self._n = 0
+
+    def push(self, k: int, x):
+        self._cubetas[k % self._nb].append(x)
+        self._n += 1
+
+    def pop(self) -> Tuple[int, Any]:
+        if not self._n:
+            raise IndexError("pop de una cola vacía")
+        cubetas, nb = self._cubetas, self._nb
+        while not cubetas[self._actual % nb]:
+            self._actual += 1
+        self._n -= 1
+        return self._actual, cubetas[self._actual % nb].pop()
+
+    def __len__(self):
+        return self._n
+
+
+class ColaRadix:
+    """
+    Radix heap para claves enteras monótonas (la clave mínima nunca baja).
+    La cubeta de una clave k es bit_length(k xor ultimo): al vaciarse la
+    cubeta 0 se redistribuye la primera cubeta no vacía.
+    Costo amortizado O(log C) por operación, C = peso máximo.
+    """
+
+    __slots__ = ("_cubetas", "_ultimo", "_n")
+
+    def __init__(self):
+        self._cubetas: List[List[Tuple[int, Any]]] = [[] for _ in range(65)]
+        self._ultimo = 0
+        self._n = 0
+
+    def push(self, k: int, x):
+        if k < self._ultimo:
+            raise ValueError("ColaRadix requiere claves monótonas")
+        b = (k ^ self._ultimo).bit_length()
+        while b >= len(self._cubetas):
+            self._cubetas.append([])
+        self._cubetas[b].append((k, x))
+        self._n += 1
+
+    def pop(self) -> Tuple[int, Any]:
+        if not self._n:
+            raise IndexError("pop de una cola vacía")
+        cubetas = self._cubetas
+        if not cubetas[0]:
+            i = 1
+            while not cubetas[i]:
+                i += 1
+            cubeta = cubetas[i]
+            cubetas[i] = []
+            ultimo = min(k for k, _ in cubeta)
+            self._ultimo = ultimo
+            for k, x in cubeta:
+                cubetas[(k ^ ultimo).bit_length()].append((k, x))
+        self._n -= 1
+        return cubetas[0].pop()
+
+    def __len__(self):
+        return self._n
+
+
+COLAS = ("heap", "dial", "radix")
@@ -1,6 +1,7 @@
 # scripts/config_p3.py
 from __future__ import annotations
 
+import math
 import sys
 from pathlib import Path
 
@@ -16,6 +17,16 @@ sys.path.insert(0, str(P1_ROOT))
 from src import modelos  # noqa: E402
 
 
+# Modelos de grafos que se generan
+MODELOS = [
+    "Malla",
+    "ErdosRenyi",
+    "Gilbert",
+    "Geografico",
+    "BarabasiAlbert",
+    "DorogovtsevMendes",
+]
+
 # Dos tamanos por modelo (pocos / muchos)
 N_POCOS = 30
 N_MUCHOS = 500
@@ -30,42 +41,92 @@ W_MAX = 10.0
 SEED_PESOS_POCOS = 111
 SEED_PESOS_MUCHOS = 222
 
+# (tag, n, seed_base, seed_pesos) por tamaño
+TAMANOS = [
+    ("pocos", N_POCOS, SEED_BASE_POCOS, SEED_PESOS_POCOS),
+    ("muchos", N_MUCHOS, SEED_BASE_MUCHOS, SEED_PESOS_MUCHOS),
+]
+
 
-def build_base_graph(modelo: str, n: int, seed: int):
+def parametros_modelo(modelo: str, n: int) -> dict:
     """
-    Construye un grafo (Proyecto 1) de acuerdo a cada modelo.
-    Ajusta parámetros para que el grafo no sea ridículamente denso.
+    Parámetros de cada modelo para n nodos.
+    n=30 y n=500 conservan los valores de siempre; para otros n se escalan
+    para mantener el grado promedio de n=500 (grafos dispersos).
     """
-    dirigido = False
-
     if modelo == "Malla":
         # Para aproximar n nodos: m*n = n
         if n == 30:
             m, k = 5, 6
+        elif n == 500:
+            m, k = 20, 25
         else:
-            m, k = 20, 25  # 500
-        return modelos.grafoMalla(m, k, dirigido=dirigido)
+            m = max(1, math.isqrt(n))
+            k = math.ceil(n / m)
+        return {"m": m, "k": k}
 
     if modelo == "ErdosRenyi":
-        # m aristas ~ 2n (sparse) para ambos tamaños
-        m = 2 * n
-        return modelos.grafoErdosRenyi(n, m, dirigido=dirigido, seed=seed)
+        # m aristas ~ 2n (sparse) para todos los tamaños
+        return {"m": 2 * n}
 
     if modelo == "Gilbert":
-        # p baja para n grande
-        p = 0.12 if n == 30 else 0.01
-        return modelos.grafoGilbert(n, p, dirigido=dirigido, seed=seed)
+        # p baja para n grande (grado promedio ~5 como en n=500)
+        if n == 30:
+            p = 0.12
+        elif n == 500:
+            p = 0.01
+        else:
+            p = min(1.0, 5.0 / n)
+        return {"p": p}
 
     if modelo == "Geografico":
-        # r típica (unit square)
-        r = 0.30 if n == 30 else 0.06
-        return modelos.grafoGeografico(n, r, dirigido=dirigido, seed=seed)
+        # r típica (unit square); r ~ 1/sqrt(n) mantiene el grado promedio
+        if n == 30:
+            r = 0.30
+        elif n == 500:
+            r = 0.06
+        else:
+            r = 0.06 * math.sqrt(500 / n)
+        return {"r": r}
 
     if modelo == "BarabasiAlbert":
-        d = 3
-        return modelos.grafoBarabasiAlbert(n, d, dirigido=dirigido, seed=seed)
+        return {"d": 3}
 
     if modelo == "DorogovtsevMendes":
-        return modelos.grafoDorogovtsevMendes(n, dirigido=dirigido, seed=seed)
+        return {}
 
     raise ValueError(f"Modelo desconocido: {modelo}")
+
+
+def build_base_graph(modelo: str, n: int, seed: int, compacto: bool = False, seed_pesos=None):
+    """
+    Construye un grafo (Proyecto 1) de acuerdo a cada modelo.
+    Ajusta parámetros para que el grafo no sea ridículamente denso.
+    compacto=True usa los generadores vectorizados (generadores_rapidos.py)
+    y regresa directamente un GrafoCSR, con pesos uniformes [W_MIN, W_MAX]
+    si se da seed_pesos (si no, 1.0); es el camino para n grandes.
+    """
+    if compacto:
+        from generadores_rapidos import generar_compacto
+
+        return generar_compacto(modelo, n, seed, seed_pesos=seed_pesos)
+
+    dirigido = False
+    prm = parametros_modelo(modelo, n)
+
+    if modelo == "Malla":
+        return modelos.grafoMalla(prm["m"], prm["k"], dirigido=dirigido)
+
+    if modelo == "ErdosRenyi":
+        return modelos.grafoErdosRenyi(n, prm["m"], dirigido=dirigido, seed=seed)
+
+    if modelo == "Gilbert":
+        return modelos.grafoGilbert(n, prm["p"], dirigido=dirigido, seed=seed)
+
+    if modelo == "Geografico":
+        return modelos.grafoGeografico(n, prm["r"], dirigido=dirigido, seed=seed)
+
+    if modelo == "BarabasiAlbert":
+        return modelos.grafoBarabasiAlbert(n, prm["d"], dirigido=dirigido, seed=seed)
+
+    return modelos.grafoDorogovtsevMendes(n, dirigido=dirigido, seed=seed)
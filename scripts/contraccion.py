@@ -0,0 +1,261 @@
+# scripts/contraccion.py
+from __future__ import annotations
+
+import heapq
+import math
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from grafo_csr import GrafoCSR
+
+
+class JerarquiaContraccion:
+    """
+    Contraction hierarchy sobre un GrafoCSR (o GrafoDijkstra vía compile()).
+    Preprocesamiento:
+    - Orden de nodos por "edge difference" con actualización perezosa
+    - Al contraer v se agrega el atajo u -> w (peso u->v->w) sólo si la
+      búsqueda testigo (acotada) no encuentra un camino igual o mejor
+    Consulta:
+    - Dijkstra bidireccional sólo hacia arriba (rango creciente) desde s
+      en el grafo hacia adelante y desde t en el grafo invertido
+    Los atajos guardan su nodo intermedio para desempacar el camino.
+    """
+
+    def __init__(
+        self,
+        ids: List[Any],
+        rango: List[int],
+        arriba: GrafoCSR,
+        abajo: GrafoCSR,
+        medio: Dict[Tuple[int, int], int],
+    ):
+        self.ids = ids
+        self.indice = arriba.indice
+        self.rango = rango
+        self.arriba = arriba  # u -> v con rango[v] > rango[u]
+        self.abajo = abajo  # v -> u por cada arco u -> v con rango[u] > rango[v]
+        self.medio = medio  # (u, w) -> v del atajo u -> v -> w
+
+    @property
+    def num_atajos(self) -> int:
+        return len(self.medio)
+
+    # ------------------------------------------------------------------
+    # Preprocesamiento
+    # ------------------------------------------------------------------
+    @staticmethod
+    def construir(g, limite_testigo: int = 64) -> "JerarquiaContraccion":
+        """
+        - g: GrafoCSR o GrafoDijkstra
+        - limite_testigo: nodos asentados máximos por búsqueda testigo
+          (más bajo = preprocesamiento más rápido, más atajos)
+        """
+        csr = g if isinstance(g, GrafoCSR) else g.compile()
+        n = csr.num_nodos
+
+        # grafo restante (nodos aún no contraídos): u -> {v: peso}
+        sal: List[Dict[int, float]] = [dict() for _ in range(n)]
+        ent: List[Dict[int, float]] = [dict() for _ in range(n)]
+        for u in range(n):
+            for v, w in csr.vecinos_idx(u):
+                if v != u and w < sal[u].get(v, math.inf):
+                    sal[u][v] = w
+                    ent[v][u] = w
+
+        medio: Dict[Tuple[int, int], int] = {}
+        contraido = bytearray(n)
+        vecinos_contraidos = [0] * n
+        rango = [0] * n
+        arcos_arriba: List[Tuple[int, int, float]] = []
+        arcos_abajo: List[Tuple[int, int, float]] = []
+
+        def testigo(u: int, v: int, limite: float, destinos: set) -> Dict[int, float]:
+            """Dijkstra acotado desde u sin pasar por v."""
+            dist = {u: 0.0}
+            heap = [(0.0, u)]
+            asentados = 0
+            faltan = len(destinos)
+            while heap and faltan:
+                d, x = heapq.heappop(heap)
+                if d > dist[x]:
+                    continue
+                if d > limite or asentados >= limite_testigo:
+                    break
+                asentados += 1
+                if x in destinos:
+                    faltan -= 1
+                for y, w in sal[x].items():
+                    if y == v:
+                        continue
+                    nd = d + w
+                    if nd < dist.get(y, math.inf):
+                        dist[y] = nd
+                        heapq.heappush(heap, (nd, y))
+            return dist
+
+        def atajos(v: int) -> List[Tuple[int, int, float]]:
+            """Atajos necesarios si se contrae v ahora."""
+            res = []
+            salidas = sal[v]
+            if not salidas:
+                return res
+            max_out = max(salidas.values())
+            for u, w_uv in ent[v].items():
+                destinos = {x for x in salidas if x != u}
+                if not destinos:
+                    continue
+                dist = testigo(u, v, w_uv + max_out, destinos)
+                for x in destinos:
+                    cand = w_uv + salidas[x]
+                    if dist.get(x, math.inf) > cand:
+                        res.append((u, x, cand))
+            return res
+
+        def prioridad(v: int) -> int:
+            return len(atajos(v)) - len(ent[v]) - len(sal[v]) + vecinos_contraidos[v]
+
+        heap = [(prioridad(v), v) for v in range(n)]
+        heapq.heapify(heap)
+        orden = 0
+
+        while heap:
+            _, v = heapq.heappop(heap)
+            if contraido[v]:
+                continue
+            # actualización perezosa: si ya no es el mínimo, regresa a la cola
+            p = prioridad(v)
+            if heap and p > heap[0][0]:
+                heapq.heappush(heap, (p, v))
+                continue
+
+            for u, x, w in atajos(v):
+                if w < sal[u].get(x, math.inf):
+                    sal[u][x] = w
+                    ent[x][u] = w
+                    medio[(u, x)] = v
+
+            # los arcos restantes de v van a nodos de rango mayor
+            for x, w in sal[v].items():
+                arcos_arriba.append((v, x, w))
+                del ent[x][v]
+                vecinos_contraidos[x] += 1
+            for u, w in ent[v].items():
+                arcos_abajo.append((v, u, w))
+                del sal[u][v]
+                vecinos_contraidos[u] += 1
+            sal[v] = {}
+            ent[v] = {}
+
+            contraido[v] = 1
+            rango[v] = orden
+            orden += 1
+
+        arriba = GrafoCSR.from_aristas(csr.ids, arcos_arriba, csr.xs, csr.ys, dirigido=True)
+        abajo = GrafoCSR.from_aristas(csr.ids, arcos_abajo, csr.xs, csr.ys, dirigido=True)
+        # sólo conservamos los atajos que sobrevivieron en la jerarquía
+        finales = {(u, x) for u, x, _ in arcos_arriba} | {(u, v) for v, u, _ in arcos_abajo}
+        medio = {k: m for k, m in medio.items() if k in finales}
+        return JerarquiaContraccion(csr.ids, rango, arriba, abajo, medio)
+
+    # ------------------------------------------------------------------
+    # Consulta
+    # ------------------------------------------------------------------
+    def shortest_path(self, s, t) -> Tuple[float, List[Any]]:
+        """
+        Distancia y camino (ids originales) de s a t; (inf, []) si no hay.
+        Mismo contrato que GrafoCSR.shortest_path.
+        """
+        if s not in self.indice or t not in self.indice:
+            raise KeyError(f"El nodo {s if s not in self.indice else t} no existe en el grafo")
+        s_i, t_i = self.indice[s], self.indice[t]
+        if s_i == t_i:
+            return 0.0, [s]
+
+        lados = (self.arriba, self.abajo)
+        dist = ({s_i: 0.0}, {t_i: 0.0})
+        parent = ({s_i: -1}, {t_i: -1})
+        heaps = ([(0.0, s_i)], [(0.0, t_i)])
+        mejor = math.inf
+        encuentro = -1
+
+        lado = 0
+        while heaps[0] or heaps[1]:
+            if not heaps[lado]:
+                lado = 1 - lado
+            heap = heaps[lado]
+            d, u = heapq.heappop(heap)
+            if d > dist[lado][u]:
+                continue
+            if d >= mejor:
+                # este lado ya no puede mejorar: se vacía
+                heap.clear()
+                lado = 1 - lado
+                continue
+
+            otro = dist[1 - lado]
+            if u in otro and d + otro[u] < mejor:
+                mejor = d + otro[u]
+                encuentro = u
+
+            g = lados[lado]
+            dist_l, parent_l = dist[lado], parent[lado]
+            for v, w in g.vecinos_idx(u):
+                nd = d + w
+                if nd < dist_l.get(v, math.inf):
+                    dist_l[v] = nd
+                    parent_l[v] = u
+                    heapq.heappush(heap, (nd, v))
+            lado = 1 - lado
+
+        if encuentro < 0:
+            return math.inf, []
+
+        # camino en la jerarquía (s -> encuentro -> t), luego se desempacan atajos
+        nodos = []
+        v = encuentro
+        while v >= 0:
+            nodos.append(v)
+            v = parent[0][v]
+        nodos.reverse()
+        v = parent[1][encuentro]
+        while v >= 0:
+            nodos.append(v)
+            v = parent[1][v]
+
+        camino = [nodos[0]]
+        for u, v in zip(nodos, nodos[1:]):
+            self._desempacar(u, v, camino)
+        return mejor, [self.ids[i] for i in camino]
+
+    def _desempacar(self, u: int, v: int, camino: List[int]):
+        """Agrega a camino los nodos de u -> v (sin u), expandiendo atajos."""
+        pila = [(u, v)]
+        while pila:
+            a, b = pila.pop()
+            m = self.medio.get((a, b))
+            if m is None:
+                camino.append(b)
+            else:
+                pila.append((m, b))
+                pila.append((a, m))
+
+    # ------------------------------------------------------------------
+    # Serialización
+    # ------------------------------------------------------------------
+    def guardar(self, path: str):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as f:
+            pickle.dump(
+                (self.ids, self.rango, self.arriba, self.abajo, self.medio),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+
+    @staticmethod
+    def cargar(path: str) -> "JerarquiaContraccion":
+        with Path(path).open("rb") as f:
+            ids, rango, arriba, abajo, medio = pickle.load(f)
+        return JerarquiaContraccion(ids, rango, arriba, abajo, medio)
@@ -0,0 +1,117 @@
+# scripts/delta_stepping.py
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from grafo_csr import GrafoCSR
+
+
+def delta_automatico(g: GrafoCSR) -> float:
+    """
+    Delta sugerido ~ peso_max / grado_promedio (Meyer & Sanders), acotado
+    abajo por el peso mínimo para que cada cubeta tenga aristas ligeras.
+    """
+    w = np.asarray(g.pesos, dtype=np.float64)
+    if w.size == 0:
+        return 1.0
+    grado = w.size / max(1, g.num_nodos)
+    return float(max(w.min(), w.max() / max(1.0, grado)))
+
+
+def _arcos_de(offsets: np.ndarray, frontera: np.ndarray) -> np.ndarray:
+    """Índices de todos los arcos que salen de los nodos de la frontera."""
+    inicios = offsets[frontera]
+    largos = offsets[frontera + 1] - inicios
+    total = int(largos.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    # inicio de cada bloque repetido + posición dentro del bloque
+    corr = np.repeat(inicios - np.cumsum(largos) + largos, largos)
+    return corr + np.arange(total, dtype=np.int64)
+
+
+def _relajar(arcos, origen, destinos, pesos, dist, parent):
+    """
+    Relaja en lote los arcos dados. Para cada destino se queda con la
+    mejor propuesta. Regresa los nodos cuya distancia mejoró.
+    """
+    if arcos.size == 0:
+        return arcos
+    u = origen[arcos]
+    v = destinos[arcos]
+    nd = dist[u] + pesos[arcos]
+
+    mejora = nd < dist[v]
+    if not mejora.any():
+        return np.empty(0, dtype=np.int64)
+    u, v, nd = u[mejora], v[mejora], nd[mejora]
+
+    # mínimo por destino: ordena por (v, nd) y toma el primero de cada v
+    orden = np.lexsort((nd, v))
+    v_o = v[orden]
+    primero = np.ones(v_o.size, dtype=bool)
+    primero[1:] = v_o[1:] != v_o[:-1]
+    sel = orden[primero]
+
+    v, nd, u = v[sel], nd[sel], u[sel]
+    dist[v] = nd
+    parent[v] = u
+    return v
+
+
+def delta_stepping(g, s, delta: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    SSSP por delta-stepping con relajaciones vectorizadas en NumPy.
+    - g: GrafoCSR o GrafoDijkstra (se usa g.compile())
+    - s: id original del nodo fuente
+    - delta: ancho de cubeta (None -> delta_automatico)
+    Regresa: (dist, parent) como GrafoCSR.dijkstra, pero en np.ndarray
+    (float64 con inf / int64 con -1).
+
+    Cada cubeta relaja todas las aristas ligeras (w <= delta) de su frontera
+    de una vez hasta vaciarse, y después las pesadas de los nodos asentados.
+    """
+    csr = g if isinstance(g, GrafoCSR) else g.compile()
+    s_i = csr.indice_de(s)
+    if delta is None:
+        delta = delta_automatico(csr)
+    if delta <= 0:
+        raise ValueError("delta debe ser > 0")
+
+    n = csr.num_nodos
+    offsets = np.asarray(csr.offsets, dtype=np.int64)
+    destinos = np.asarray(csr.destinos, dtype=np.int64)
+    pesos = np.asarray(csr.pesos, dtype=np.float64)
+    origen = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+    ligera = pesos <= delta
+
+    dist = np.full(n, np.inf)
+    parent = np.full(n, -1, dtype=np.int64)
+    asentado = np.zeros(n, dtype=bool)
+    dist[s_i] = 0.0
+
+    while True:
+        pendientes = np.flatnonzero(~asentado & np.isfinite(dist))
+        if pendientes.size == 0:
+            break
+        cub = np.floor(dist[pendientes] / delta)
+        i = cub.min()
+        limite = (i + 1) * delta
+
+        frontera = pendientes[cub == i]
+        en_cubeta = []
+        while frontera.size:
+            en_cubeta.append(frontera)
+            arcos = _arcos_de(offsets, frontera)
+            arcos = arcos[ligera[arcos]]
+            mejorados = _relajar(arcos, origen, destinos, pesos, dist, parent)
+            frontera = mejorados[dist[mejorados] < limite]
+
+        r = np.unique(np.concatenate(en_cubeta))
+        asentado[r] = True
+        arcos = _arcos_de(offsets, r)
+        _relajar(arcos[~ligera[arcos]], origen, destinos, pesos, dist, parent)
+
+    return dist, parent
@@ -0,0 +1,48 @@
+# scripts/estadisticas_dijkstra.py
+from __future__ import annotations
+
+from typing import Dict
+
+
+class EstadisticasDijkstra:
+    """
+    Contadores del ciclo principal de Dijkstra (opt-in: Dijkstra(s, stats=...)).
+    - pushes / pops: operaciones sobre la cola
+    - pops_obsoletos: pops descartados por visited (borrado perezoso)
+    - relajaciones: actualizaciones exitosas de dist
+    - aristas_examinadas: arcos revisados desde nodos asentados
+    - cola_max: tamaño máximo que alcanzó la cola
+    Se pueden acumular varias corridas con acumular().
+    """
+
+    __slots__ = ("pushes", "pops", "pops_obsoletos", "relajaciones", "aristas_examinadas", "cola_max")
+
+    def __init__(self):
+        self.pushes = 0
+        self.pops = 0
+        self.pops_obsoletos = 0
+        self.relajaciones = 0
+        self.aristas_examinadas = 0
+        self.cola_max = 0
+
+    @property
+    def asentados(self) -> int:
+        return self.pops - self.pops_obsoletos
+
+    def acumular(self, otra: "EstadisticasDijkstra") -> "EstadisticasDijkstra":
+        self.pushes += otra.pushes
+        self.pops += otra.pops
+        self.pops_obsoletos += otra.pops_obsoletos
+        self.relajaciones += otra.relajaciones
+        self.aristas_examinadas += otra.aristas_examinadas
+        self.cola_max = max(self.cola_max, otra.cola_max)
+        return self
+
+    def como_dict(self) -> Dict[str, int]:
+        d = {k: getattr(self, k) for k in self.__slots__}
+        d["asentados"] = self.asentados
+        return d
+
+    def __repr__(self):
+        campos = ", ".join(f"{k}={v}" for k, v in self.como_dict().items())
+        return f"EstadisticasDijkstra({campos})"
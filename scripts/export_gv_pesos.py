@@ -1,39 +1,92 @@
 # scripts/export_gv_pesos.py
 from __future__ import annotations
+
+import gzip
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
+# Tamaño del buffer de escritura: las líneas se escriben conforme se generan
+BUFFER_BYTES = 1 << 20
 
-def export_graphviz(g, path: str, peso_fn=None):
-    """
-    Exporta un .gv:
-    - g: Grafo (P1) o GrafoDijkstra
-    - peso_fn(u_id, v_id) -> float (si quieres label de peso en la arista)
-    """
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
 
+def _lineas_graphviz(g, peso_fn=None, color_fn=None) -> Iterator[str]:
     directed = getattr(g, "dirigido", False)
     head = "digraph G {" if directed else "graph G {"
     conn = "->" if directed else "--"
 
-    lines = [head]
-    lines.append("  overlap=false;")
+    yield head
+    yield "  overlap=false;"
 
     # nodos
     for n in g.nodos():
+        attrs = []
         if n.x is not None and n.y is not None:
-            lines.append(f'  "{n.id}" [pos="{n.x},{n.y}!"];')
+            attrs.append(f'pos="{n.x},{n.y}!"')
+        if color_fn is not None:
+            color = color_fn(n.id)
+            if color is not None:
+                attrs.append(f'style=filled, fillcolor="{color}"')
+        if attrs:
+            yield f'  "{n.id}" [{", ".join(attrs)}];'
         else:
-            lines.append(f'  "{n.id}";')
+            yield f'  "{n.id}";'
 
     # aristas
     for a in g.aristas():
         u, v = a.origen.id, a.destino.id
         if peso_fn is None:
-            lines.append(f'  "{u}" {conn} "{v}";')
+            yield f'  "{u}" {conn} "{v}";'
         else:
             w = float(peso_fn(u, v))
-            lines.append(f'  "{u}" {conn} "{v}" [label="{w:.2f}"];')
+            yield f'  "{u}" {conn} "{v}" [label="{w:.2f}"];'
+
+    yield "}"
+
 
-    lines.append("}")
-    path.write_text("\n".join(lines), encoding="utf-8")
+def export_graphviz(g, path: str, peso_fn=None, color_fn=None):
+    """
+    Exporta un .gv:
+    - g: Grafo (P1) o GrafoDijkstra
+    - peso_fn(u_id, v_id) -> float (si quieres label de peso en la arista)
+    - color_fn(id) -> "#rrggbb" o None (relleno del nodo, p. ej. la celda
+      de ResultadoVoronoi.color_fn())
+    Si path termina en .gz se escribe comprimido con gzip (p. ej. .gv.gz).
+    Las líneas se escriben en streaming por un writer con buffer, así que
+    la memoria no crece con el tamaño del grafo.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if path.suffix == ".gz":
+        f = gzip.open(path, "wt", encoding="utf-8")
+    else:
+        f = path.open("w", encoding="utf-8", buffering=BUFFER_BYTES)
+
+    with f:
+        lineas = _lineas_graphviz(g, peso_fn, color_fn)
+        f.write(next(lineas))
+        for linea in lineas:
+            f.write("\n")
+            f.write(linea)
+
+
+def _export_tarea(trabajo) -> str:
+    g, path, peso_fn = trabajo
+    export_graphviz(g, path, peso_fn=peso_fn)
+    return str(path)
+
+
+def export_graphviz_batch(
+    trabajos: Iterable[Tuple[object, str, Optional[Callable]]],
+    workers: Optional[int] = None,
+) -> List[str]:
+    """
+    Exporta varios grafos en paralelo con un pool de procesos.
+    - trabajos: (g, path, peso_fn) como en export_graphviz; g y peso_fn
+      deben poder serializarse con pickle (p. ej. g.peso_arista)
+    - workers: procesos del pool (None -> os.cpu_count())
+    Regresa las rutas escritas, en el mismo orden que trabajos.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(_export_tarea, trabajos))
@@ -0,0 +1,186 @@
+# scripts/formato_binario.py
+from __future__ import annotations
+
+import json
+import struct
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+
+from grafo_csr import GrafoCSR
+
+# Formato .gdb (little-endian):
+#   MAGIA (4 bytes) | largo del header (uint32) | header JSON (utf-8)
+#   relleno hasta múltiplo de 8
+#   xs (n f8) | ys (n f8) | offsets (n+1 i8) | destinos (m i8) | pesos (m f8)
+#   ids originales en JSON (utf-8), sólo si no son 0..n-1
+# El header guarda n, m, dirigido e ids: "rango" (0..n-1) o "final" con
+# largo_ids. Los ids van al final para que se pueda abrir el grafo sin
+# decodificarlos (con_ids=False).
+MAGIA = b"GDB1"
+_ALINEACION = 8
+
+
+def _codificar_id(nid) -> Any:
+    # JSON no tiene tuplas (ids de Malla): se marcan para recuperarlas
+    if isinstance(nid, tuple):
+        return {"t": [_codificar_id(x) for x in nid]}
+    return nid
+
+
+def _decodificar_id(x) -> Any:
+    if isinstance(x, dict):
+        return tuple(_decodificar_id(y) for y in x["t"])
+    return x
+
+
+def _partes(g: GrafoCSR) -> Tuple[bytes, bytes]:
+    """
+    (cabecera, ids): la cabecera es MAGIA + largo + header JSON + relleno
+    (todo lo que va antes de los buffers); ids es la sección final (b"" si
+    son 0..n-1).
+    """
+    n, m = g.num_nodos, g.num_arcos
+    ids = g.ids
+    header: Dict[str, Any] = {"n": n, "m": m, "dirigido": g.dirigido}
+    if ids == range(n) or all(type(nid) is int and nid == i for i, nid in enumerate(ids)):
+        header["ids"] = "rango"
+        seccion_ids = b""
+    else:
+        seccion_ids = json.dumps([_codificar_id(nid) for nid in ids]).encode("utf-8")
+        header["ids"] = "final"
+        header["largo_ids"] = len(seccion_ids)
+
+    datos = json.dumps(header).encode("utf-8")
+    inicio = len(MAGIA) + 4 + len(datos)
+    relleno = (-inicio) % _ALINEACION
+    return MAGIA + struct.pack("<I", len(datos)) + datos + b"\0" * relleno, seccion_ids
+
+
+def _buffers(g: GrafoCSR):
+    return (
+        (g.xs, "<f8"),
+        (g.ys, "<f8"),
+        (g.offsets, "<i8"),
+        (g.destinos, "<i8"),
+        (g.pesos, "<f8"),
+    )
+
+
+def tamano_binario(g: GrafoCSR) -> int:
+    """Bytes que ocupa g en formato .gdb."""
+    cab, ids = _partes(g)
+    return len(cab) + 8 * (2 * g.num_nodos + (g.num_nodos + 1) + 2 * g.num_arcos) + len(ids)
+
+
+def save_binary(g: GrafoCSR, path: str):
+    """Escribe un GrafoCSR en formato binario .gdb (ver encabezado del módulo)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    cab, ids = _partes(g)
+    with path.open("wb") as f:
+        f.write(cab)
+        for buf, dtype in _buffers(g):
+            np.asarray(buf).astype(dtype, copy=False).tofile(f)
+        f.write(ids)
+
+
+def escribir_en(g: GrafoCSR, destino) -> int:
+    """
+    Escribe g en formato .gdb dentro de un buffer ya reservado (p. ej. el
+    .buf de una SharedMemory de tamano_binario(g) bytes). Regresa los bytes escritos.
+    """
+    destino = memoryview(destino).cast("B")
+    cab, ids = _partes(g)
+    destino[:len(cab)] = cab
+    off = len(cab)
+    for buf, dtype in _buffers(g):
+        arr = np.asarray(buf).astype(dtype, copy=False)
+        np.frombuffer(destino, dtype=dtype, count=arr.size, offset=off)[:] = arr
+        off += arr.size * 8
+    destino[off:off + len(ids)] = ids
+    return off + len(ids)
+
+
+def _leer_header(cabeza: bytes, origen) -> Tuple[dict, int]:
+    """(header, offset del primer buffer) a partir de los primeros bytes."""
+    if bytes(cabeza[:len(MAGIA)]) != MAGIA:
+        raise ValueError(f"{origen} no está en formato .gdb")
+    (largo,) = struct.unpack("<I", bytes(cabeza[len(MAGIA):len(MAGIA) + 4]))
+    ini = len(MAGIA) + 4
+    header = json.loads(bytes(cabeza[ini:ini + largo]).decode("utf-8"))
+    off = ini + largo
+    return header, off + (-off) % _ALINEACION
+
+
+def _formas(header: dict):
+    n, m = header["n"], header["m"]
+    return ((n, "<f8"), (n, "<f8"), (n + 1, "<i8"), (m, "<i8"), (m, "<f8"))
+
+
+def _ids(header: dict, leer_seccion: Callable[[int], bytes], con_ids: bool = True):
+    """
+    ids del grafo. leer_seccion(largo) regresa la sección final de ids;
+    sólo se llama (y se decodifica) si hace falta.
+    """
+    if header["ids"] == "rango" or not con_ids:
+        return range(header["n"])
+    ids = json.loads(leer_seccion(header["largo_ids"]).decode("utf-8"))
+    return [_decodificar_id(x) for x in ids]
+
+
+def _armar(header: dict, bufs, ids) -> GrafoCSR:
+    xs, ys, offsets, destinos, pesos = bufs
+    return GrafoCSR(ids, offsets, destinos, pesos, xs, ys, dirigido=header["dirigido"])
+
+
+def desde_buffer(buf, con_ids: bool = True) -> GrafoCSR:
+    """
+    GrafoCSR cuyos buffers son vistas (sin copia) de buf, que contiene un
+    .gdb completo (p. ej. memoria compartida, ver memoria_compartida.py).
+    con_ids=False deja ids = range(n) (índices densos) y no lee la sección
+    de ids originales.
+    """
+    buf = memoryview(buf).cast("B")
+    header, off = _leer_header(buf, "el buffer")
+    bufs = []
+    for count, dtype in _formas(header):
+        bufs.append(memoryview(np.frombuffer(buf, dtype=dtype, count=count, offset=off)).toreadonly())
+        off += count * 8
+    return _armar(header, bufs, _ids(header, lambda largo: bytes(buf[off:off + largo]), con_ids))
+
+
+def load_binary(path: str, mmap: bool = True) -> GrafoCSR:
+    """
+    Carga un .gdb como GrafoCSR.
+    - mmap=True: los buffers son vistas de numpy.memmap (cero copias; sólo se
+      lee del disco lo que Dijkstra toca)
+    - mmap=False: se leen completos a memoria
+    Los buffers se exponen como memoryview para que los ciclos en Python
+    indexen enteros/floats nativos; NumPy los vuelve a ver sin copiar.
+    """
+    path = Path(path)
+    with path.open("rb") as f:
+        cabeza = f.read(len(MAGIA) + 4)
+        if len(cabeza) == len(MAGIA) + 4 and cabeza[:len(MAGIA)] == MAGIA:
+            (largo,) = struct.unpack("<I", cabeza[len(MAGIA):])
+            cabeza += f.read(largo)
+    header, off = _leer_header(cabeza, path)
+
+    bufs = []
+    for count, dtype in _formas(header):
+        if mmap:
+            arr = np.memmap(path, dtype=dtype, mode="r", offset=off, shape=(count,)) if count else np.empty(0, dtype)
+        else:
+            arr = np.fromfile(path, dtype=dtype, count=count, offset=off)
+        bufs.append(memoryview(arr))
+        off += count * 8
+
+    def leer_seccion(largo: int) -> bytes:
+        with path.open("rb") as f:
+            f.seek(off)
+            return f.read(largo)
+
+    return _armar(header, bufs, _ids(header, leer_seccion))
@@ -0,0 +1,222 @@
+# scripts/generadores_rapidos.py
+from __future__ import annotations
+
+import random
+from typing import Optional, Tuple
+
+import numpy as np
+
+from config_p3 import W_MIN, W_MAX, parametros_modelo
+from grafo_csr import GrafoCSR
+
+# Generadores vectorizados para n grandes (10^5 - 10^6 nodos). Producen
+# aristas como arreglos (u, v) y las vuelcan directo a un GrafoCSR, sin
+# pasar por los objetos Nodo/Arista del Proyecto 1.
+# Siguen los mismos modelos que src.modelos pero NO reproducen sus
+# grafos bit a bit (usan otro generador de números aleatorios).
+
+Aristas = Tuple[np.ndarray, np.ndarray]
+
+
+def csr_desde_arreglos(ids, u, v, w, xs, ys) -> GrafoCSR:
+    """CSR no dirigido a partir de aristas (u, v, w) en arreglos."""
+    n = len(ids)
+    src = np.concatenate([u, v])
+    dst = np.concatenate([v, u])
+    ww = np.concatenate([w, w])
+    orden = np.argsort(src, kind="stable")
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=offsets[1:])
+    return GrafoCSR(
+        ids,
+        memoryview(offsets),
+        memoryview(np.ascontiguousarray(dst[orden], dtype=np.int64)),
+        memoryview(np.ascontiguousarray(ww[orden], dtype=np.float64)),
+        memoryview(np.ascontiguousarray(xs, dtype=np.float64)),
+        memoryview(np.ascontiguousarray(ys, dtype=np.float64)),
+        dirigido=False,
+    )
+
+
+def _par_desde_lineal(L: np.ndarray) -> Aristas:
+    """Índice lineal del triángulo superior -> (i, j) con i < j (L = j(j-1)/2 + i)."""
+    j = np.floor((1.0 + np.sqrt(1.0 + 8.0 * L.astype(np.float64))) / 2.0).astype(np.int64)
+    # corrige el redondeo de sqrt en índices grandes
+    j -= (j * (j - 1) // 2) > L
+    j += ((j + 1) * j // 2) <= L
+    i = L - j * (j - 1) // 2
+    return i, j
+
+
+def gilbert(n: int, p: float, seed: int) -> Aristas:
+    """G(n, p) por muestreo geométrico de saltos: O(n + m) en vez de O(n^2)."""
+    total = n * (n - 1) // 2
+    if p <= 0 or total == 0:
+        return np.empty(0, np.int64), np.empty(0, np.int64)
+    if p >= 1:
+        return _par_desde_lineal(np.arange(total, dtype=np.int64))
+
+    rng = np.random.default_rng(seed)
+    esperado = total * p
+    partes = []
+    ultimo = -1
+    while True:
+        k = int(esperado + 6 * np.sqrt(esperado) + 16)
+        pos = ultimo + np.cumsum(rng.geometric(p, size=k))
+        dentro = pos[pos < total]
+        partes.append(dentro)
+        if dentro.size < pos.size:
+            break
+        ultimo = int(pos[-1])
+    return _par_desde_lineal(np.concatenate(partes))
+
+
+def erdos_renyi(n: int, m: int, seed: int) -> Aristas:
+    """G(n, m): m pares distintos muestreados sobre los índices lineales."""
+    total = n * (n - 1) // 2
+    m = min(m, total)
+    rng = np.random.default_rng(seed)
+    L = np.empty(0, dtype=np.int64)
+    while L.size < m:
+        extra = int((m - L.size) * 1.1) + 16
+        L = np.unique(np.concatenate([L, rng.integers(0, total, size=extra)]))
+    if L.size > m:
+        L = np.sort(rng.choice(L, size=m, replace=False))
+    return _par_desde_lineal(L)
+
+
+def geografico(n: int, r: float, seed: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Grafo geométrico en el cuadrado unitario con una rejilla de celdas de
+    lado >= r: sólo se comparan puntos de celdas vecinas (O(n) esperado).
+    Regresa (u, v, xs, ys).
+    """
+    rng = np.random.default_rng(seed)
+    xs = rng.random(n)
+    ys = rng.random(n)
+
+    g = max(1, int(1.0 / r))
+    cx = np.minimum((xs * g).astype(np.int64), g - 1)
+    cy = np.minimum((ys * g).astype(np.int64), g - 1)
+    celda = cx * g + cy
+    orden = np.argsort(celda, kind="stable")
+    cnt = np.bincount(celda, minlength=g * g)
+    inicio = np.zeros(g * g, dtype=np.int64)
+    np.cumsum(cnt[:-1], out=inicio[1:])
+
+    us, vs = [], []
+    puntos = np.arange(n, dtype=np.int64)
+    # cada par de celdas vecinas se visita una sola vez
+    for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+        nx, ny = cx + dx, cy + dy
+        ok = (nx >= 0) & (nx < g) & (ny >= 0) & (ny < g)
+        a = puntos[ok]
+        nc = nx[ok] * g + ny[ok]
+        reps = cnt[nc]
+        tot = int(reps.sum())
+        if tot == 0:
+            continue
+        a_rep = np.repeat(a, reps)
+        pos = np.repeat(inicio[nc] - np.cumsum(reps) + reps, reps) + np.arange(tot, dtype=np.int64)
+        b = orden[pos]
+        sel = (a_rep < b) if (dx, dy) == (0, 0) else np.ones(tot, dtype=bool)
+        sel &= np.hypot(xs[a_rep] - xs[b], ys[a_rep] - ys[b]) <= r
+        us.append(a_rep[sel])
+        vs.append(b[sel])
+
+    if not us:
+        return np.empty(0, np.int64), np.empty(0, np.int64), xs, ys
+    return np.concatenate(us), np.concatenate(vs), xs, ys
+
+
+def barabasi_albert(n: int, d: int, seed: int) -> Aristas:
+    """
+    Preferential attachment con arreglo de nodos repetidos: cada nodo
+    aparece una vez por cada arista que toca, así que elegir al azar de
+    ese arreglo es elegir proporcional al grado (O(n d)).
+    """
+    rnd = random.Random(seed)
+    us, vs = [], []
+    repetidos = []
+    destinos = list(range(min(d, n)))
+    for nuevo in range(len(destinos), n):
+        for t in destinos:
+            us.append(nuevo)
+            vs.append(t)
+        repetidos.extend(destinos)
+        repetidos.extend([nuevo] * len(destinos))
+        elegidos = set()
+        while len(elegidos) < min(d, nuevo + 1):
+            elegidos.add(rnd.choice(repetidos))
+        destinos = list(elegidos)
+    return np.array(us, dtype=np.int64), np.array(vs, dtype=np.int64)
+
+
+def dorogovtsev_mendes(n: int, seed: int) -> Aristas:
+    """Triángulo inicial; cada nodo nuevo se une a los extremos de una arista al azar."""
+    rnd = random.Random(seed)
+    us, vs = [0, 1, 0], [1, 2, 2]
+    if n < 3:
+        k = max(0, n - 1)
+        us, vs = us[:k], vs[:k]
+    for nuevo in range(3, n):
+        e = rnd.randrange(len(us))
+        a, b = us[e], vs[e]
+        us += [nuevo, nuevo]
+        vs += [a, b]
+    return np.array(us, dtype=np.int64), np.array(vs, dtype=np.int64)
+
+
+def malla(m: int, k: int) -> Tuple[list, np.ndarray, np.ndarray]:
+    """Malla m x k emitida como arreglos; ids (i, j) como en grafoMalla."""
+    idx = np.arange(m * k, dtype=np.int64).reshape(m, k)
+    u = np.concatenate([idx[:, :-1].ravel(), idx[:-1, :].ravel()])
+    v = np.concatenate([idx[:, 1:].ravel(), idx[1:, :].ravel()])
+    ids = [(i, j) for i in range(m) for j in range(k)]
+    return ids, u, v
+
+
+def aristas_compactas(modelo: str, n: int, seed: int):
+    """
+    Aristas del modelo como arreglos, con los parámetros de
+    config_p3.parametros_modelo. Regresa (ids, u, v, xs, ys); xs/ys son NaN
+    si el modelo no tiene coordenadas.
+    """
+    prm = parametros_modelo(modelo, n)
+    xs = ys = None
+
+    if modelo == "Malla":
+        ids, u, v = malla(prm["m"], prm["k"])
+    else:
+        ids = range(n)
+        if modelo == "ErdosRenyi":
+            u, v = erdos_renyi(n, prm["m"], seed)
+        elif modelo == "Gilbert":
+            u, v = gilbert(n, prm["p"], seed)
+        elif modelo == "Geografico":
+            u, v, xs, ys = geografico(n, prm["r"], seed)
+        elif modelo == "BarabasiAlbert":
+            u, v = barabasi_albert(n, prm["d"], seed)
+        else:
+            u, v = dorogovtsev_mendes(n, seed)
+
+    if xs is None:
+        xs = np.full(len(ids), np.nan)
+        ys = np.full(len(ids), np.nan)
+    return ids, u, v, xs, ys
+
+
+def pesos_compactos(m: int, seed_pesos: Optional[int] = None) -> np.ndarray:
+    """m pesos uniformes en [W_MIN, W_MAX] (1.0 si no hay seed_pesos)."""
+    if seed_pesos is None:
+        return np.ones(m)
+    return np.random.default_rng(seed_pesos).uniform(W_MIN, W_MAX, size=m)
+
+
+def generar_compacto(modelo: str, n: int, seed: int, seed_pesos: Optional[int] = None) -> GrafoCSR:
+    """
+    GrafoCSR del modelo con los parámetros de config_p3.parametros_modelo.
+    Pesos uniformes en [W_MIN, W_MAX] si se da seed_pesos; si no, 1.0.
+    """
+    ids, u, v, xs, ys = aristas_compactas(modelo, n, seed)
+    return csr_desde_arreglos(ids, u, v, pesos_compactos(len(u), seed_pesos), xs, ys)
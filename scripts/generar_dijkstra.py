@@ -1,56 +1,37 @@
 # scripts/generar_dijkstra.py
 from __future__ import annotations
 
-from pathlib import Path
+import argparse
 
-from config_p3 import (
-    ROOT,
-    N_POCOS, N_MUCHOS,
-    SEED_BASE_POCOS, SEED_BASE_MUCHOS,
-    W_MIN, W_MAX, SEED_PESOS_POCOS, SEED_PESOS_MUCHOS,
-    build_base_graph,
-)
-from grafo_dijkstra import GrafoDijkstra
-from export_gv_pesos import export_graphviz
+from config_p3 import MODELOS, TAMANOS
+from manifiesto import Manifiesto, huella_dijkstra
+from pipeline import exportar_dijkstra, grafo_pesado
 
 
-MODELOS = [
-    "Malla",
-    "ErdosRenyi",
-    "Gilbert",
-    "Geografico",
-    "BarabasiAlbert",
-    "DorogovtsevMendes",
-]
-
-
-def choose_source_id(g: GrafoDijkstra):
-    # fuente: primer nodo del grafo (determinístico por construcción del modelo)
-    return g.nodos()[0].id
-
-
-def main():
-    out_dir = ROOT / "outputs" / "gv" / "dijkstra"
+def main(forzar: bool = False):
+    manifiesto = Manifiesto(forzar=forzar)
 
     for modelo in MODELOS:
-        for tag, n, seed_base, seed_w in [
-            ("pocos", N_POCOS, SEED_BASE_POCOS, SEED_PESOS_POCOS),
-            ("muchos", N_MUCHOS, SEED_BASE_MUCHOS, SEED_PESOS_MUCHOS),
-        ]:
-            base = build_base_graph(modelo, n, seed_base)
-            g = GrafoDijkstra.from_grafo(base)
-            g.asignar_pesos_uniformes(W_MIN, W_MAX, seed=seed_w)
-
-            s = choose_source_id(g)
-            T, dist = g.Dijkstra(s)
-
-            path = out_dir / modelo / f"{modelo}_{tag}_n{n}_dijkstra_s{s}.gv"
-            export_graphviz(T, str(path), peso_fn=None)
+        for tag, n, seed_base, seed_w in TAMANOS:
+            # la ruta depende de la fuente: sale del manifiesto si no hay cambios
+            clave = f"dijkstra/{modelo}/{tag}"
+            h = huella_dijkstra(modelo, n, seed_base, seed_w)
+            if manifiesto.al_dia(clave, h):
+                print(f"[=] {manifiesto.salidas(clave)[0]} (sin cambios)")
+                continue
+
+            g = grafo_pesado(modelo, n, seed_base, seed_w)
+            path, s = exportar_dijkstra(g, modelo, tag, n)
+            manifiesto.registrar(clave, h, [path])
 
             print(f"[OK] {path} (fuente={s})")
 
+    manifiesto.guardar()
     print("Listo: árboles Dijkstra exportados.")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Calcula y exporta los árboles Dijkstra.")
+    parser.add_argument("--forzar", action="store_true", help="ignora el manifiesto y regenera todo")
+    args = parser.parse_args()
+    main(forzar=args.forzar)
@@ -1,48 +1,36 @@
 # scripts/generar_grafos_pesados.py
 from __future__ import annotations
 
-from pathlib import Path
+import argparse
 
-from config_p3 import (
-    ROOT,
-    N_POCOS, N_MUCHOS,
-    SEED_BASE_POCOS, SEED_BASE_MUCHOS,
-    W_MIN, W_MAX, SEED_PESOS_POCOS, SEED_PESOS_MUCHOS,
-    build_base_graph,
-)
-from grafo_dijkstra import GrafoDijkstra
-from export_gv_pesos import export_graphviz
+from config_p3 import MODELOS, TAMANOS
+from manifiesto import Manifiesto, huella_generados
+from pipeline import exportar_generado, grafo_pesado
 
 
-MODELOS = [
-    "Malla",
-    "ErdosRenyi",
-    "Gilbert",
-    "Geografico",
-    "BarabasiAlbert",
-    "DorogovtsevMendes",
-]
-
-
-def main():
-    out_dir = ROOT / "outputs" / "gv" / "generados"
+def main(forzar: bool = False):
+    manifiesto = Manifiesto(forzar=forzar)
 
     for modelo in MODELOS:
-        for tag, n, seed_base, seed_w in [
-            ("pocos", N_POCOS, SEED_BASE_POCOS, SEED_PESOS_POCOS),
-            ("muchos", N_MUCHOS, SEED_BASE_MUCHOS, SEED_PESOS_MUCHOS),
-        ]:
-            base = build_base_graph(modelo, n, seed_base)
-            g = GrafoDijkstra.from_grafo(base)
-            g.asignar_pesos_uniformes(W_MIN, W_MAX, seed=seed_w)
+        for tag, n, seed_base, seed_w in TAMANOS:
+            clave = f"generados/{modelo}/{tag}"
+            h = huella_generados(modelo, n, seed_base, seed_w)
+            if manifiesto.al_dia(clave, h):
+                print(f"[=] {manifiesto.salidas(clave)[0]} (sin cambios)")
+                continue
 
-            path = out_dir / modelo / f"{modelo}_{tag}_n{n}.gv"
-            export_graphviz(g, str(path), peso_fn=g.peso_arista)
+            g = grafo_pesado(modelo, n, seed_base, seed_w)
+            path = exportar_generado(g, modelo, tag, n)
+            manifiesto.registrar(clave, h, [path])
 
             print(f"[OK] {path}")
 
+    manifiesto.guardar()
     print("Listo: grafos generados con pesos.")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Genera los grafos con pesos.")
+    parser.add_argument("--forzar", action="store_true", help="ignora el manifiesto y regenera todo")
+    args = parser.parse_args()
+    main(forzar=args.forzar)
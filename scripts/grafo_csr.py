@@ -0,0 +1,432 @@
+# scripts/grafo_csr.py
+from __future__ import annotations
+
+import heapq
+import math
+from array import array
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+class _IndiceRango:
+    """Mapeo id -> índice cuando los ids ya son 0..n-1 (evita un dict de n)."""
+
+    __slots__ = ("n",)
+
+    def __init__(self, n: int):
+        self.n = n
+
+    def __contains__(self, nid) -> bool:
+        return type(nid) is int and 0 <= nid < self.n
+
+    def __getitem__(self, nid) -> int:
+        if nid not in self:
+            raise KeyError(nid)
+        return nid
+
+    def __len__(self):
+        return self.n
+
+
+def _como_array(buf, codigo: str) -> array:
+    """buf como array.array (copia sólo si es memoryview / vista de NumPy)."""
+    if isinstance(buf, array) and buf.typecode == codigo:
+        return buf
+    a = array(codigo)
+    try:
+        mv = memoryview(buf)
+    except TypeError:  # listas u otras secuencias
+        return array(codigo, buf)
+    if mv.itemsize != a.itemsize:
+        return array(codigo, buf)
+    a.frombytes(mv.cast("B"))
+    return a
+
+
+class GrafoCSR:
+    """
+    Representación compacta y congelada de un GrafoDijkstra:
+    - Los ids originales se re-etiquetan a enteros densos 0..n-1
+    - Adyacencia en formato CSR: offsets (n+1), destinos (m) y pesos (m)
+    - Coordenadas x/y en buffers contiguos (NaN si el nodo no tiene)
+
+    Los buffers son array.array (o memoryview sobre arreglos de NumPy, p. ej.
+    al cargar con formato_binario.load_binary); en ambos casos NumPy puede
+    verlos con numpy.asarray sin copiar. ids puede ser range(n).
+    En grafos no dirigidos cada arista aparece en ambos sentidos.
+    """
+
+    __slots__ = ("dirigido", "ids", "indice", "offsets", "destinos", "pesos", "xs", "ys", "_rev", "_escala", "_coords")
+
+    def __init__(
+        self,
+        ids: List[Hashable],
+        offsets: Sequence[int],
+        destinos: Sequence[int],
+        pesos: Sequence[float],
+        xs: Sequence[float],
+        ys: Sequence[float],
+        dirigido: bool = False,
+    ):
+        self.dirigido = dirigido
+        self.ids = ids
+        if isinstance(ids, range) and ids.start == 0 and ids.step == 1:
+            self.indice = _IndiceRango(len(ids))
+        else:
+            self.indice = {nid: i for i, nid in enumerate(ids)}
+        self.offsets = offsets
+        self.destinos = destinos
+        self.pesos = pesos
+        self.xs = xs
+        self.ys = ys
+        self._rev: Optional["GrafoCSR"] = None
+        self._escala: Optional[float] = None
+        self._coords: Optional[bool] = None
+
+    @staticmethod
+    def from_aristas(
+        ids: List[Hashable],
+        aristas: Sequence[Tuple[int, int, float]],
+        xs: Sequence[float],
+        ys: Sequence[float],
+        dirigido: bool = False,
+    ) -> "GrafoCSR":
+        """
+        Construye el CSR a partir de aristas (i, j, peso) sobre índices densos.
+        Si el grafo no es dirigido se agrega también (j, i, peso).
+        Conserva el orden de inserción dentro de cada lista de adyacencia.
+        """
+        n = len(ids)
+        grado = [0] * n
+        for i, j, _ in aristas:
+            grado[i] += 1
+            if not dirigido:
+                grado[j] += 1
+
+        offsets = array("q", [0]) * (n + 1)
+        acc = 0
+        for i in range(n):
+            offsets[i] = acc
+            acc += grado[i]
+        offsets[n] = acc
+
+        destinos = array("q", [0]) * acc
+        pesos = array("d", [0.0]) * acc
+        pos = list(offsets[:n])
+        for i, j, w in aristas:
+            k = pos[i]
+            destinos[k] = j
+            pesos[k] = w
+            pos[i] = k + 1
+            if not dirigido:
+                k = pos[j]
+                destinos[k] = i
+                pesos[k] = w
+                pos[j] = k + 1
+
+        return GrafoCSR(ids, offsets, destinos, pesos, xs, ys, dirigido=dirigido)
+
+    def __reduce__(self):
+        # memoryview (load_binary, memoria compartida, generadores_rapidos)
+        # no se puede serializar: se envían copias como array.array, p. ej.
+        # a los workers de un pool con spawn. Los caches se recalculan.
+        return (
+            GrafoCSR,
+            (
+                self.ids,
+                _como_array(self.offsets, "q"),
+                _como_array(self.destinos, "q"),
+                _como_array(self.pesos, "d"),
+                _como_array(self.xs, "d"),
+                _como_array(self.ys, "d"),
+                self.dirigido,
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # Consultas básicas
+    # ------------------------------------------------------------------
+    @property
+    def num_nodos(self) -> int:
+        return len(self.ids)
+
+    @property
+    def num_arcos(self) -> int:
+        """Número de arcos almacenados (2m si el grafo no es dirigido)."""
+        return len(self.destinos)
+
+    def indice_de(self, nid: Hashable) -> int:
+        if nid not in self.indice:
+            raise KeyError(f"El nodo {nid} no existe en el grafo")
+        return self.indice[nid]
+
+    def id_de(self, i: int) -> Any:
+        return self.ids[i]
+
+    def vecinos_idx(self, i: int):
+        """Itera (j, peso) de los arcos que salen de i."""
+        a, b = self.offsets[i], self.offsets[i + 1]
+        return zip(self.destinos[a:b], self.pesos[a:b])
+
+    def transpuesto(self) -> "GrafoCSR":
+        """
+        CSR con los arcos invertidos (para búsquedas hacia atrás).
+        En grafos no dirigidos es el mismo objeto.
+        """
+        if not self.dirigido:
+            return self
+        if self._rev is None:
+            aristas = []
+            offsets, destinos, pesos = self.offsets, self.destinos, self.pesos
+            for u in range(self.num_nodos):
+                for k in range(offsets[u], offsets[u + 1]):
+                    aristas.append((destinos[k], u, pesos[k]))
+            self._rev = GrafoCSR.from_aristas(self.ids, aristas, self.xs, self.ys, dirigido=True)
+        return self._rev
+
+    # ------------------------------------------------------------------
+    # Dijkstra
+    # ------------------------------------------------------------------
+    def dijkstra(self, s) -> Tuple[array, array]:
+        """
+        Dijkstra sobre los buffers CSR.
+        - s: id original del nodo fuente
+        Regresa: (dist, parent)
+        - dist: array('d') indexado por índice denso (inf si no alcanzable)
+        - parent: array('q') con el índice del padre (-1 si no tiene)
+        """
+        s_i = self.indice_de(s)
+        n = self.num_nodos
+        offsets, destinos, pesos = self.offsets, self.destinos, self.pesos
+
+        dist = array("d", [math.inf]) * n
+        parent = array("q", [-1]) * n
+        visited = bytearray(n)
+        dist[s_i] = 0.0
+
+        heap = [(0.0, s_i)]
+        pop, push = heapq.heappop, heapq.heappush
+
+        while heap:
+            d_u, u = pop(heap)
+            if visited[u]:
+                continue
+            visited[u] = 1
+
+            for k in range(offsets[u], offsets[u + 1]):
+                v = destinos[k]
+                nd = d_u + pesos[k]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    push(heap, (nd, v))
+
+        return dist, parent
+
+    def save_binary(self, path: str):
+        """Guarda en formato .gdb (ver formato_binario.py)."""
+        from formato_binario import save_binary
+
+        save_binary(self, path)
+
+    def delta_stepping(self, s, delta: Optional[float] = None):
+        """
+        Mismo contrato (dist, parent) que dijkstra(), pero con el motor
+        vectorizado de delta_stepping.py (requiere NumPy).
+        """
+        from delta_stepping import delta_stepping
+
+        return delta_stepping(self, s, delta=delta)
+
+    def _camino(self, parent: Sequence[int], t_i: int) -> List[Any]:
+        """Reconstruye el camino (ids originales) desde la raíz hasta t_i.
+        parent puede ser un arreglo por índice o un dict índice -> padre."""
+        camino = []
+        v = t_i
+        while v >= 0:
+            camino.append(self.ids[v])
+            v = parent[v]
+        camino.reverse()
+        return camino
+
+    def shortest_path(self, s, t, bidireccional: bool = False) -> Tuple[float, List[Any]]:
+        """
+        Camino más corto punto a punto (sin construir el árbol completo).
+        - Unidireccional: se detiene en cuanto t queda asentado.
+        - bidireccional=True: búsqueda desde s y hacia atrás desde t
+          que se encuentran en medio.
+        Regresa: (distancia, camino) con ids originales; (inf, []) si t
+        no es alcanzable.
+        """
+        s_i = self.indice_de(s)
+        t_i = self.indice_de(t)
+        if s_i == t_i:
+            return 0.0, [s]
+        if bidireccional:
+            return self._shortest_path_bidireccional(s_i, t_i)
+
+        offsets, destinos, pesos = self.offsets, self.destinos, self.pesos
+        dist = {s_i: 0.0}
+        parent = {s_i: -1}
+        visited = set()
+
+        heap = [(0.0, s_i)]
+        pop, push = heapq.heappop, heapq.heappush
+
+        while heap:
+            d_u, u = pop(heap)
+            if u in visited:
+                continue
+            if u == t_i:
+                return d_u, self._camino(parent, u)
+            visited.add(u)
+
+            for k in range(offsets[u], offsets[u + 1]):
+                v = destinos[k]
+                nd = d_u + pesos[k]
+                if nd < dist.get(v, math.inf):
+                    dist[v] = nd
+                    parent[v] = u
+                    push(heap, (nd, v))
+
+        return math.inf, []
+
+    def _shortest_path_bidireccional(self, s_i: int, t_i: int) -> Tuple[float, List[Any]]:
+        rev = self.transpuesto()
+        lados = (
+            (self.offsets, self.destinos, self.pesos),
+            (rev.offsets, rev.destinos, rev.pesos),
+        )
+        dist = ({s_i: 0.0}, {t_i: 0.0})
+        parent = ({s_i: -1}, {t_i: -1})
+        visited = (set(), set())
+        heaps = ([(0.0, s_i)], [(0.0, t_i)])
+        pop, push = heapq.heappop, heapq.heappush
+
+        mejor = math.inf
+        encuentro = -1
+
+        while heaps[0] and heaps[1]:
+            # criterio de paro: ningún camino restante puede mejorar "mejor"
+            if heaps[0][0][0] + heaps[1][0][0] >= mejor:
+                break
+
+            # expande el lado con la cola más pequeña
+            lado = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+            heap = heaps[lado]
+            d_u, u = pop(heap)
+            if u in visited[lado]:
+                continue
+            visited[lado].add(u)
+
+            offsets, destinos, pesos = lados[lado]
+            dist_l, parent_l = dist[lado], parent[lado]
+            dist_o = dist[1 - lado]
+            for k in range(offsets[u], offsets[u + 1]):
+                v = destinos[k]
+                nd = d_u + pesos[k]
+                if nd < dist_l.get(v, math.inf):
+                    dist_l[v] = nd
+                    parent_l[v] = u
+                    push(heap, (nd, v))
+                if v in dist_o:
+                    total = dist_l[v] + dist_o[v]
+                    if total < mejor:
+                        mejor = total
+                        encuentro = v
+
+        if encuentro < 0:
+            return math.inf, []
+
+        # s -> encuentro (padres hacia adelante) + encuentro -> t (padres hacia atrás)
+        camino = self._camino(parent[0], encuentro)
+        v = parent[1][encuentro]
+        while v >= 0:
+            camino.append(self.ids[v])
+            v = parent[1][v]
+        return mejor, camino
+
+    # ------------------------------------------------------------------
+    # A* (heurística euclidiana)
+    # ------------------------------------------------------------------
+    def tiene_coordenadas(self) -> bool:
+        """True si todos los nodos tienen x/y (no NaN). Se calcula una vez."""
+        if self._coords is None:
+            self._coords = not any(math.isnan(x) for x in self.xs) and not any(math.isnan(y) for y in self.ys)
+        return self._coords
+
+    def escala_heuristica(self) -> float:
+        """
+        Mayor c tal que c * distancia_euclidiana(u, v) <= peso(u, v) en todo arco.
+        Con esa c, h(v) = c * |v - t| es una cota inferior consistente.
+        """
+        if self._escala is None:
+            xs, ys = self.xs, self.ys
+            offsets, destinos, pesos = self.offsets, self.destinos, self.pesos
+            c = math.inf
+            for u in range(self.num_nodos):
+                xu, yu = xs[u], ys[u]
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = destinos[k]
+                    e = math.hypot(xu - xs[v], yu - ys[v])
+                    if e > 0.0:
+                        c = min(c, pesos[k] / e)
+            # sin arcos con longitud > 0 la heurística no aporta: h = 0
+            # (el margen absorbe el redondeo y mantiene la consistencia)
+            self._escala = 0.0 if math.isinf(c) else c * (1.0 - 1e-12)
+        return self._escala
+
+    def astar(self, s, t) -> Tuple[float, List[Any]]:
+        """
+        A* de s a t usando la distancia euclidiana escalada como heurística.
+        Si algún nodo no tiene coordenadas cae a shortest_path (Dijkstra).
+        Regresa: (distancia, camino) igual que shortest_path.
+        """
+        if not self.tiene_coordenadas():
+            return self.shortest_path(s, t)
+
+        s_i = self.indice_de(s)
+        t_i = self.indice_de(t)
+        if s_i == t_i:
+            return 0.0, [s]
+
+        c = self.escala_heuristica()
+        xs, ys = self.xs, self.ys
+        xt, yt = xs[t_i], ys[t_i]
+        hypot = math.hypot
+
+        offsets, destinos, pesos = self.offsets, self.destinos, self.pesos
+        dist = {s_i: 0.0}
+        parent = {s_i: -1}
+        visited = set()
+
+        heap = [(c * hypot(xs[s_i] - xt, ys[s_i] - yt), s_i)]
+        pop, push = heapq.heappop, heapq.heappush
+
+        while heap:
+            _, u = pop(heap)
+            if u in visited:
+                continue
+            if u == t_i:
+                return dist[u], self._camino(parent, u)
+            visited.add(u)
+
+            d_u = dist[u]
+            for k in range(offsets[u], offsets[u + 1]):
+                v = destinos[k]
+                nd = d_u + pesos[k]
+                if nd < dist.get(v, math.inf):
+                    dist[v] = nd
+                    parent[v] = u
+                    push(heap, (nd + c * hypot(xs[v] - xt, ys[v] - yt), v))
+
+        return math.inf, []
+
+    def dist_dict(self, dist: Sequence[float]) -> Dict[Hashable, float]:
+        """Convierte un arreglo de distancias por índice a dict id_original -> dist."""
+        ids = self.ids
+        return {ids[i]: float(dist[i]) for i in range(len(ids))}
+
+    def parent_dict(self, parent: Sequence[int]) -> Dict[Hashable, Any]:
+        """Convierte un arreglo de padres por índice a dict id_original -> id_padre."""
+        ids = self.ids
+        return {ids[i]: (ids[p] if p >= 0 else None) for i, p in enumerate(parent)}
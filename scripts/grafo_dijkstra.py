@@ -4,26 +4,117 @@ from __future__ import annotations
 import heapq
 import math
 import random
-from typing import Dict, Tuple, Any
+from array import array
+from typing import Callable, Dict, Tuple, Any, Optional
 
 from src.grafo import Grafo
+from cache_dijkstra import CacheLRU
+from colas import COLAS, ColaBinaria, ColaDial, ColaRadix
+from estadisticas_dijkstra import EstadisticasDijkstra
+from grafo_csr import GrafoCSR
+from motores_sssp import TOLERANCIA_DEFAULT, obtener_motor, validar as validar_motores
+from resultado_spt import ResultadoSPT, ResultadoVoronoi
+
+
+def dijkstra_heap(g, s) -> ResultadoSPT:
+    """
+    Dijkstra de referencia (heap binario con borrado perezoso).
+    g sólo necesita nodos(), vecinos(id) y peso_arista(u, v): lo usan
+    GrafoDijkstra y VistaPesada.
+    """
+    dist = {n.id: math.inf for n in g.nodos()}
+    parent = {n.id: None for n in g.nodos()}
+    dist[s] = 0.0
+
+    heap = [(0.0, s)]
+    visited = set()
+
+    while heap:
+        d_u, u_id = heapq.heappop(heap)
+        if u_id in visited:
+            continue
+        visited.add(u_id)
+
+        for v in g.vecinos(u_id):
+            v_id = v.id
+            w = g.peso_arista(u_id, v_id)
+            nd = d_u + w
+            if nd < dist[v_id]:
+                dist[v_id] = nd
+                parent[v_id] = u_id
+                heapq.heappush(heap, (nd, v_id))
+
+    return ResultadoSPT(g, s, dist, parent)
+
+
+def dijkstra_multifuente(g, fuentes) -> ResultadoVoronoi:
+    """
+    Dijkstra con todas las fuentes en el heap a distancia 0 (una sola pasada).
+    Cada nodo hereda el dueño (fuente) de su padre, así que el resultado es
+    la partición de Voronoi del grafo. Empates: gana la primera fuente que
+    alcanza al nodo (determinista para el mismo grafo y orden de fuentes).
+    """
+    dist = {n.id: math.inf for n in g.nodos()}
+    parent = {n.id: None for n in g.nodos()}
+    dueno = {n.id: None for n in g.nodos()}
+
+    heap = []
+    for f in fuentes:
+        dist[f] = 0.0
+        dueno[f] = f
+        heap.append((0.0, f))
+    heapq.heapify(heap)
+    visited = set()
+
+    while heap:
+        d_u, u_id = heapq.heappop(heap)
+        if u_id in visited:
+            continue
+        visited.add(u_id)
+        f_u = dueno[u_id]
+
+        for v in g.vecinos(u_id):
+            v_id = v.id
+            w = g.peso_arista(u_id, v_id)
+            nd = d_u + w
+            if nd < dist[v_id]:
+                dist[v_id] = nd
+                parent[v_id] = u_id
+                dueno[v_id] = f_u
+                heapq.heappush(heap, (nd, v_id))
+
+    return ResultadoVoronoi(g, fuentes, dist, parent, dueno)
 
 
 class GrafoDijkstra(Grafo):
     """
     Extiende Grafo (Proyecto 1) SIN modificarlo:
     - Maneja pesos en un dict interno (por key de arista)
-    - Implementa Dijkstra(s) y regresa el árbol SPT como Grafo (P1)
-      con nodos renombrados "id (dist)".
+    - Implementa Dijkstra(s) y regresa un ResultadoSPT; el árbol SPT como
+      Grafo (P1) con nodos renombrados "id (dist)" se arma bajo demanda.
+    - compile() congela el grafo en una forma CSR (ver grafo_csr.py).
+    - version: contador que sube con cada mutación (nodos, aristas, pesos);
+      invalida compile() y el cache opcional de Dijkstra (activar_cache).
     """
 
     def __init__(self, dirigido: bool = False):
         super().__init__(dirigido=dirigido)
         self._w: Dict[Tuple[Any, Any], float] = {}  # key_arista -> peso
+        self.version = 0
+        self._csr: Optional[GrafoCSR] = None  # cache de compile()
+        self._csr_version = -1
+        self._cache: Optional[CacheLRU] = None  # cache opcional de Dijkstra
+        self._cache_version = 0
+
+    def add_nodo(self, *args, **kwargs):
+        ok = super().add_nodo(*args, **kwargs)
+        self.version += 1
+        return ok
 
     def add_arista(self, u_id, v_id, peso: float = 1.0) -> bool:
         ok = super().add_arista(u_id, v_id)
         if ok:
+            self.version += 1
             if peso <= 0:
                 raise ValueError("Dijkstra requiere pesos positivos (>0)")
             u = self.get_nodo(u_id)
@@ -32,6 +123,33 @@ class GrafoDijkstra(Grafo):
             self._w[k] = float(peso)
         return ok
 
+    def agregar_lote(self, nodos, aristas) -> int:
+        """
+        Inserción en bloque.
+        - nodos: [(id, x, y)] (x/y pueden ser None)
+        - aristas: [(u_id, v_id, peso)]
+        Valida los pesos una sola vez, sube version una vez y asigna los
+        pesos con un solo update (en vez de add_nodo/add_arista por objeto).
+        Regresa el número de aristas nuevas.
+        """
+        aristas = list(aristas)
+        if aristas and min(w for _, _, w in aristas) <= 0:
+            raise ValueError("Dijkstra requiere pesos positivos (>0)")
+
+        # métodos del P1 directos: sin el costo por llamada de los overrides
+        add_nodo, add_arista = Grafo.add_nodo, Grafo.add_arista
+        for nid, x, y in nodos:
+            add_nodo(self, nid, x=x, y=y)
+
+        key, get = self._key_arista, self.get_nodo
+        nuevos = {}
+        for u_id, v_id, peso in aristas:
+            if add_arista(self, u_id, v_id):
+                nuevos[key(get(u_id), get(v_id))] = float(peso)
+        self._w.update(nuevos)
+        self.version += 1
+        return len(nuevos)
+
     def set_peso(self, u_id, v_id, peso: float):
         if peso <= 0:
             raise ValueError("Dijkstra requiere pesos positivos (>0)")
@@ -41,6 +159,7 @@ class GrafoDijkstra(Grafo):
         if k not in self._aristas_key:
             raise KeyError(f"No existe arista entre {u_id} y {v_id}")
         self._w[k] = float(peso)
+        self.version += 1
 
     def peso_arista(self, u_id, v_id) -> float:
         u = self.get_nodo(u_id)
@@ -58,60 +177,288 @@ class GrafoDijkstra(Grafo):
             g.add_arista(a.origen.id, a.destino.id, peso=1.0)
         return g
 
+    def compile(self) -> GrafoCSR:
+        """
+        Congela el grafo en un GrafoCSR (ids densos + buffers contiguos).
+        El resultado se cachea hasta la siguiente mutación (ver version).
+        """
+        if self._csr is not None and self._csr_version == self.version:
+            return self._csr
+
+        nodos = self.nodos()
+        ids = [n.id for n in nodos]
+        idx = {nid: i for i, nid in enumerate(ids)}
+        xs = array("d", [math.nan if n.x is None else float(n.x) for n in nodos])
+        ys = array("d", [math.nan if n.y is None else float(n.y) for n in nodos])
+
+        w = self._w
+        aristas = []
+        for a in self.aristas():
+            u, v = a.origen, a.destino
+            peso = w.get(self._key_arista(u, v), 1.0)
+            aristas.append((idx[u.id], idx[v.id], peso))
+
+        self._csr = GrafoCSR.from_aristas(ids, aristas, xs, ys, dirigido=self.dirigido)
+        self._csr_version = self.version
+        return self._csr
+
+    def save_binary(self, path: str):
+        """Guarda la forma compilada en formato binario .gdb (requiere NumPy)."""
+        self.compile().save_binary(path)
+
+    @staticmethod
+    def load_binary(path: str, mmap: bool = True) -> GrafoCSR:
+        """
+        Carga un .gdb como GrafoCSR (forma compacta, sólo lectura).
+        Con mmap=True los buffers se mapean de disco sin copiar.
+        """
+        from formato_binario import load_binary
+
+        return load_binary(path, mmap=mmap)
+
+    def shortest_path(self, s, t, bidireccional: bool = False):
+        """
+        Distancia y camino de s a t sin construir el árbol SPT.
+        Ver GrafoCSR.shortest_path (se usa la forma compilada en cache).
+        """
+        return self.compile().shortest_path(s, t, bidireccional=bidireccional)
+
+    def astar(self, s, t):
+        """
+        A* de s a t con heurística euclidiana sobre las coordenadas x/y
+        (p. ej. grafos de grafoGeografico). Sin coordenadas cae a Dijkstra.
+        Ver GrafoCSR.astar.
+        """
+        return self.compile().astar(s, t)
+
     def asignar_pesos_uniformes(self, w_min: float, w_max: float, seed: int):
         rng = random.Random(seed)
         for a in self.aristas():
             u, v = a.origen.id, a.destino.id
             self.set_peso(u, v, rng.uniform(w_min, w_max))
+        self.version += 1
+
+    def asignar_pesos(self, pesos):
+        """
+        Asigna todos los pesos de una vez.
+        - pesos: secuencia (p. ej. np.ndarray de pesos.py) alineada con self.aristas()
+        Valida longitud y positividad una sola vez y sube version una vez.
+        """
+        aristas = self.aristas()
+        pesos = [float(w) for w in pesos]
+        if len(pesos) != len(aristas):
+            raise ValueError(f"Se esperaban {len(aristas)} pesos, llegaron {len(pesos)}")
+        if pesos and min(pesos) <= 0:
+            raise ValueError("Dijkstra requiere pesos positivos (>0)")
+        key = self._key_arista
+        self._w.update(zip((key(a.origen, a.destino) for a in aristas), pesos))
+        self.version += 1
 
-    def Dijkstra(self, s):
+    # ------------------------------------------------------------------
+    # Cache de resultados de Dijkstra (opcional)
+    # ------------------------------------------------------------------
+    def activar_cache(self, max_entradas: Optional[int] = 128, max_bytes: Optional[int] = None):
         """
-        Regresa: (T, dist)
-        - T: Grafo(P1) dirigido, árbol SPT desde s
-        - dist: dict id_original -> distancia (float/inf)
+        Activa un cache LRU de ResultadoSPT con llave (version, s, motor).
+        Un resultado nunca se sirve después de una mutación: la versión
+        cambia y las entradas viejas se descartan en el siguiente acceso.
+        Los resultados cacheados se comparten: no modificar dist/parent.
+        """
+        self._cache = CacheLRU(max_entradas=max_entradas, max_bytes=max_bytes)
+        self._cache_version = self.version
+
+    def desactivar_cache(self):
+        self._cache = None
+
+    def estadisticas_cache(self) -> Optional[Dict[str, int]]:
+        return None if self._cache is None else self._cache.estadisticas()
+
+    def Dijkstra(
+        self,
+        s,
+        cola: str = "heap",
+        resolucion: Optional[float] = None,
+        stats: Optional[EstadisticasDijkstra] = None,
+        on_settle: Optional[Callable[[Any, float], None]] = None,
+        on_relax: Optional[Callable[[Any, Any, float], None]] = None,
+        motor: str = "heap",
+        validar: Optional[str] = None,
+        tol: float = TOLERANCIA_DEFAULT,
+    ):
+        """
+        Regresa: ResultadoSPT (ver resultado_spt.py)
+        - .dist: dict id_original -> distancia (float/inf)
+        - .parent: dict id_original -> id del padre (None en s / no alcanzables)
+        - .as_grafo(): árbol SPT como Grafo(P1) dirigido, construido bajo demanda
+        Se puede seguir desempacando como (T, dist).
+
+        cola: "heap" (binario, por defecto), "dial" o "radix" (ver colas.py).
+        Dial y radix necesitan pesos enteros; con pesos reales hay que dar
+        resolucion para cuantizarlos a ceil(w / resolucion) unidades.
+        Con pesos enteros las distancias son idénticas a las del heap.
+        Con resolucion, dist es la longitud real del camino elegido y
+        dist_exacta <= dist <= dist_exacta + resolucion * (aristas del camino óptimo).
+
+        Instrumentación (opt-in, sin costo si no se pide):
+        - stats: EstadisticasDijkstra que se llena y queda en resultado.stats
+        - on_settle(u, dist_u): al asentar cada nodo
+        - on_relax(u, v, nueva_dist): en cada relajación exitosa
+        Las corridas instrumentadas no usan el cache.
+
+        motor: "heap" (referencia), "csr" (g.compile()) o "scipy"
+        (scipy.sparse.csgraph, si está instalado); ver motores_sssp.py.
+        Los motores distintos de "heap" sólo aceptan la cola por defecto y
+        no se pueden instrumentar.
+        validar="heap" (u otro motor) corre también ese motor sobre el mismo
+        s y lanza AssertionError si alguna distancia difiere más de tol.
+        Las corridas validadas no usan el cache.
         """
         if s not in self._nodos:
             raise KeyError(f"El nodo fuente {s} no existe en el grafo")
+        if cola not in COLAS:
+            raise ValueError(f"Cola desconocida: {cola} (opciones: {', '.join(COLAS)})")
+        instrumentada = stats is not None or on_settle is not None or on_relax is not None
+        if motor != "heap":
+            obtener_motor(motor)
+            if cola != "heap" or resolucion is not None or instrumentada:
+                raise ValueError(f"El motor {motor} no admite cola/resolucion ni instrumentación")
+
+        if validar is not None:
+            if motor == "heap" and (cola != "heap" or resolucion is not None or instrumentada):
+                raise ValueError("validar sólo compara motores con la cola por defecto")
+            return validar_motores(self, s, motor, validar, tol)
+
+        if instrumentada:
+            return self._dijkstra_cola(s, cola, resolucion, stats, on_settle, on_relax)
+
+        cache = self._cache
+        if cache is None:
+            return self._dijkstra(s, cola, resolucion, motor)
+
+        if self._cache_version != self.version:
+            v = self.version
+            cache.descartar(lambda k: k[0] != v)
+            self._cache_version = v
+        key = (self.version, s, (cola, resolucion, motor))
+        res = cache.get(key)
+        if res is None:
+            res = self._dijkstra(s, cola, resolucion, motor)
+            cache.put(key, res)
+        return res
+
+    def DijkstraMultifuente(self, fuentes) -> ResultadoVoronoi:
+        """
+        Fuente más cercana de cada nodo en una sola pasada (en vez de k
+        Dijkstra y un mínimo sobre k dicts). Regresa ResultadoVoronoi:
+        .dist, .dueno y .parent por nodo; .celdas() y .color_fn() para
+        exportar la partición con export_graphviz(..., color_fn=...).
+        Las fuentes repetidas se ignoran.
+        """
+        fuentes = list(dict.fromkeys(fuentes))
+        if not fuentes:
+            raise ValueError("Se requiere al menos una fuente")
+        for f in fuentes:
+            if f not in self._nodos:
+                raise KeyError(f"El nodo fuente {f} no existe en el grafo")
+        return dijkstra_multifuente(self, fuentes)
+
+    def _dijkstra(self, s, cola: str, resolucion: Optional[float], motor: str = "heap"):
+        """Dijkstra sin cache (heap binario con borrado perezoso por defecto)."""
+        if cola != "heap" or resolucion is not None:
+            return self._dijkstra_cola(s, cola, resolucion)
+        if motor != "heap":
+            return obtener_motor(motor)(self, s)
+
+        return dijkstra_heap(self, s)
+
+    def _cuantizador(self, cola: str, resolucion: Optional[float]):
+        """Función peso -> clave de la cola (entera >= 1 para dial/radix)."""
+        if cola == "heap" and resolucion is None:
+            def q(w: float) -> float:
+                return w
+        elif resolucion is None:
+            def q(w: float) -> int:
+                if not w.is_integer():
+                    raise ValueError(
+                        "Las colas dial/radix requieren pesos enteros; usa resolucion=..."
+                    )
+                return int(w)
+        else:
+            if resolucion <= 0:
+                raise ValueError("resolucion debe ser > 0")
+
+            def q(w: float) -> int:
+                return max(1, math.ceil(w / resolucion))
+        return q
+
+    def _dijkstra_cola(
+        self,
+        s,
+        cola: str,
+        resolucion: Optional[float],
+        stats: Optional[EstadisticasDijkstra] = None,
+        on_settle: Optional[Callable[[Any, float], None]] = None,
+        on_relax: Optional[Callable[[Any, Any, float], None]] = None,
+    ):
+        """
+        Dijkstra sobre una cola de colas.py con clave entera, cuantizada o
+        (heap) la distancia misma. También es el camino instrumentado.
+        """
+        q = self._cuantizador(cola, resolucion)
+        if cola == "dial":
+            # 1.0 cubre aristas sin peso asignado (peso_arista usa ese default)
+            pq = ColaDial(q(max(1.0, max(self._w.values(), default=1.0))))
+        elif cola == "radix":
+            pq = ColaRadix()
+        else:
+            pq = ColaBinaria()
 
         dist = {n.id: math.inf for n in self.nodos()}
         parent = {n.id: None for n in self.nodos()}
+        clave = {s: 0}
         dist[s] = 0.0
 
-        heap = [(0.0, s)]
+        pq.push(0, s)
         visited = set()
 
-        while heap:
-            d_u, u_id = heapq.heappop(heap)
+        medir = stats is not None
+        pushes, pops, obsoletos, relajaciones, examinadas, cola_max = 1, 0, 0, 0, 0, 1
+
+        while pq:
+            k_u, u_id = pq.pop()
+            pops += 1
             if u_id in visited:
+                obsoletos += 1
                 continue
             visited.add(u_id)
+            d_u = dist[u_id]
+            if on_settle is not None:
+                on_settle(u_id, d_u)
 
             for v in self.vecinos(u_id):
                 v_id = v.id
                 w = self.peso_arista(u_id, v_id)
-                nd = d_u + w
-                if nd < dist[v_id]:
-                    dist[v_id] = nd
+                examinadas += 1
+                nk = k_u + q(w)
+                if nk < clave.get(v_id, math.inf):
+                    clave[v_id] = nk
+                    dist[v_id] = d_u + w
                     parent[v_id] = u_id
-                    heapq.heappush(heap, (nd, v_id))
+                    pq.push(nk, v_id)
+                    relajaciones += 1
+                    if on_relax is not None:
+                        on_relax(u_id, v_id, dist[v_id])
+                    if medir and len(pq) > cola_max:
+                        cola_max = len(pq)
 
-        def label(nid):
-            if math.isinf(dist[nid]):
-                return f"{nid} (inf)"
-            return f"{nid} ({dist[nid]:.2f})"
-
-        # Árbol dirigido para visualización (padre -> hijo)
-        T = Grafo(dirigido=True)
-        new_id = {nid: label(nid) for nid in dist.keys()}
-
-        # nodos (con mismas coords)
-        for nid, nodo in self._nodos.items():
-            T.add_nodo(new_id[nid], x=nodo.x, y=nodo.y)
-
-        # aristas del SPT
-        for v_id, u_id in parent.items():
-            if u_id is None:
-                continue
-            T.add_arista(new_id[u_id], new_id[v_id])
+        if medir:
+            # relajaciones == pushes - 1 (el push inicial de s)
+            pushes += relajaciones
+            stats.pushes += pushes
+            stats.pops += pops
+            stats.pops_obsoletos += obsoletos
+            stats.relajaciones += relajaciones
+            stats.aristas_examinadas += examinadas
+            stats.cola_max = max(stats.cola_max, cola_max)
 
-        return T, dist
+        return ResultadoSPT(self, s, dist, parent, stats=stats)
@@ -0,0 +1,94 @@
+# scripts/import_gv_pesos.py
+from __future__ import annotations
+
+import ast
+import gzip
+import math
+import re
+from array import array
+from pathlib import Path
+
+from grafo_csr import GrafoCSR
+from grafo_dijkstra import GrafoDijkstra
+
+# Subconjunto de DOT que escribe export_graphviz (una declaración por línea)
+_RE_ARISTA = re.compile(r'^\s*"(.*?)"\s*(--|->)\s*"(.*?)"\s*(?:\[label="([^"]*)"\])?\s*;\s*$')
+_RE_NODO = re.compile(
+    r'^\s*"(.*?)"\s*(?:\[(?:pos="([^,"]+),([^!"]+)!")?(?:,?\s*style=filled, fillcolor="[^"]*")?\])?\s*;\s*$'
+)
+
+
+def _parsear_id(txt: str):
+    """Recupera ids int / tupla (Malla); cualquier otra cosa queda como str."""
+    if txt and (txt[0] in "-(" or txt[0].isdigit()):
+        try:
+            v = ast.literal_eval(txt)
+        except (ValueError, SyntaxError):
+            return txt
+        if type(v) in (int, tuple) and str(v) == txt:
+            return v
+    return txt
+
+
+def _parsear_num(txt: str):
+    # int si así se escribió, para que la ida y vuelta sea exacta
+    try:
+        return int(txt)
+    except ValueError:
+        return float(txt)
+
+
+def import_graphviz(path: str, compacto: bool = False):
+    """
+    Lee un .gv (o .gv.gz) escrito por export_graphviz, línea por línea.
+    - Nodos con o sin pos="x,y!" (el fillcolor de color_fn se ignora)
+    - Aristas "--" / "->" con label de peso opcional (default 1.0)
+    Regresa un GrafoDijkstra, o un GrafoCSR si compacto=True (sin pasar
+    por nodos/aristas de P1).
+    Nodos y aristas se juntan en una sola pasada y se insertan en bloque
+    al final (GrafoDijkstra.agregar_lote / GrafoCSR.from_aristas).
+    Exportar el resultado con el mismo peso_fn reproduce el archivo.
+    """
+    path = Path(path)
+    abrir = gzip.open if path.suffix == ".gz" else open
+
+    dirigido = False
+    nodos = []  # (id, x, y)
+    aristas = []  # (u_id, v_id, peso)
+
+    with abrir(path, "rt", encoding="utf-8") as f:
+        for num, linea in enumerate(f, start=1):
+            linea = linea.strip()
+            if not linea or linea == "}" or linea.startswith("overlap"):
+                continue
+            if linea.endswith("{"):
+                dirigido = linea.startswith("digraph")
+                continue
+
+            m = _RE_ARISTA.match(linea)
+            if m:
+                peso = float(m.group(4)) if m.group(4) is not None else 1.0
+                aristas.append((_parsear_id(m.group(1)), _parsear_id(m.group(3)), peso))
+                continue
+
+            m = _RE_NODO.match(linea)
+            if m:
+                x = _parsear_num(m.group(2)) if m.group(2) is not None else None
+                y = _parsear_num(m.group(3)) if m.group(3) is not None else None
+                nodos.append((_parsear_id(m.group(1)), x, y))
+                continue
+
+            raise ValueError(f"{path}:{num}: línea no reconocida: {linea!r}")
+
+    if not compacto:
+        g = GrafoDijkstra(dirigido=dirigido)
+        g.agregar_lote(nodos, aristas)
+        return g
+
+    ids = [nid for nid, _, _ in nodos]
+    indice = {nid: i for i, nid in enumerate(ids)}
+    xs = array("d", [math.nan if x is None else x for _, x, _ in nodos])
+    ys = array("d", [math.nan if y is None else y for _, _, y in nodos])
+    return GrafoCSR.from_aristas(
+        ids, [(indice[u], indice[v], peso) for u, v, peso in aristas], xs, ys, dirigido=dirigido
+    )
@@ -0,0 +1,245 @@
+# scripts/layout_fa2.py
+from __future__ import annotations
+
+import math
+from typing import Optional
+
+import numpy as np
+
+# ForceAtlas2 (Jacomy et al.) en NumPy, con los mismos parámetros que usaba
+# gephi_batch_export.py: scalingRatio=2, gravity=1, sin linLog, y una
+# segunda fase con adjustSizes (prevent overlap).
+# La repulsión es O(n log n) con un quadtree Barnes–Hut completo: en cada
+# nivel cada nodo interactúa con el centro de masa de las celdas bien
+# separadas (hijas de las vecinas de su celda padre que no son vecinas de
+# la suya); en el último nivel las celdas vecinas se calculan exacto.
+
+EXACTO_MAX = 500  # hasta aquí la repulsión exacta O(n^2) es más rápida
+NIVEL_MAX = 10
+
+
+def grados(g) -> np.ndarray:
+    """Grado de cada nodo del GrafoCSR (entrada + salida si es dirigido)."""
+    offsets = np.asarray(g.offsets, dtype=np.int64)
+    grado = np.diff(offsets)
+    if g.dirigido:
+        grado = grado + np.bincount(np.asarray(g.destinos, dtype=np.int64), minlength=g.num_nodos)
+    return grado
+
+
+def _arcos(g):
+    """(u, v) de cada arista una sola vez (en no dirigidos el CSR trae ambos sentidos)."""
+    offsets = np.asarray(g.offsets, dtype=np.int64)
+    u = np.repeat(np.arange(g.num_nodos, dtype=np.int64), np.diff(offsets))
+    v = np.asarray(g.destinos, dtype=np.int64)
+    if not g.dirigido:
+        sel = u < v
+        u, v = u[sel], v[sel]
+    return u, v
+
+
+def _repulsion_par(dx, dy, mi, mj, kr, ri, rj):
+    """Fuerza de repulsión (componente x, y) sobre i para pares explícitos."""
+    d2 = dx * dx + dy * dy
+    d = np.sqrt(d2)
+    if ri is None:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f = np.where(d2 > 0, kr * mi * mj / d2, 0.0)
+    else:
+        # adjustSizes: distancia entre bordes; traslape => repulsión fuerte
+        dp = d - ri - rj
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f = np.where(dp > 0, kr * mi * mj / (d * dp), np.where(dp < 0, 100.0 * kr * mi * mj / d, 0.0))
+            f = np.where(d > 0, f, 0.0)
+    return f * dx, f * dy
+
+
+def _repulsion_exacta(x, y, masa, kr, radio):
+    dx = x[:, None] - x[None, :]
+    dy = y[:, None] - y[None, :]
+    ri = rj = None
+    if radio is not None:
+        ri, rj = radio[:, None], radio[None, :]
+    fx, fy = _repulsion_par(dx, dy, masa[:, None], masa[None, :], kr, ri, rj)
+    return fx.sum(axis=1), fy.sum(axis=1)
+
+
+def _repulsion_barnes_hut(x, y, masa, kr, radio):
+    n = x.size
+    x0, y0 = x.min(), y.min()
+    span = max(x.max() - x0, y.max() - y0) * (1 + 1e-9) or 1.0
+
+    niveles = min(NIVEL_MAX, math.ceil(math.log(max(n, 4) / 4.0, 4)))
+    if radio is not None and radio.max() > 0:
+        # celdas de lado >= 2 * radio máximo: todo traslape cae en celdas vecinas
+        niveles = min(niveles, int(math.log2(span / (2.0 * radio.max()))))
+    niveles = max(2, niveles)
+    lado = 1 << niveles
+    cx = np.minimum(((x - x0) / span * lado).astype(np.int64), lado - 1)
+    cy = np.minimum(((y - y0) / span * lado).astype(np.int64), lado - 1)
+
+    # masa y centro de masa por celda, del nivel fino hacia arriba
+    celda = cx * lado + cy
+    M = np.bincount(celda, weights=masa, minlength=lado * lado).reshape(lado, lado)
+    MX = np.bincount(celda, weights=masa * x, minlength=lado * lado).reshape(lado, lado)
+    MY = np.bincount(celda, weights=masa * y, minlength=lado * lado).reshape(lado, lado)
+    piramide = [(M, MX, MY)]
+    for _ in range(niveles - 2):
+        M, MX, MY = (A.reshape(A.shape[0] // 2, 2, A.shape[1] // 2, 2).sum(axis=(1, 3)) for A in (M, MX, MY))
+        piramide.append((M, MX, MY))
+    piramide.reverse()  # piramide[k] es el nivel k + 2
+
+    fx = np.zeros(n)
+    fy = np.zeros(n)
+
+    # campo lejano: lista de interacción por nivel
+    for k, (M, MX, MY) in enumerate(piramide):
+        s = 2 + k
+        ls = 1 << s
+        ax = cx >> (niveles - s)
+        ay = cy >> (niveles - s)
+        bx = (ax >> 1) * 2
+        by = (ay >> 1) * 2
+        for ox in range(-2, 4):
+            X = bx + ox
+            dentro_x = (X >= 0) & (X < ls)
+            lejos_x = np.abs(X - ax) > 1
+            for oy in range(-2, 4):
+                Y = by + oy
+                ok = dentro_x & (Y >= 0) & (Y < ls) & (lejos_x | (np.abs(Y - ay) > 1))
+                if not ok.any():
+                    continue
+                i = np.flatnonzero(ok)
+                Xi, Yi = X[i], Y[i]
+                mc = M[Xi, Yi]
+                lleno = mc > 0
+                i, Xi, Yi, mc = i[lleno], Xi[lleno], Yi[lleno], mc[lleno]
+                dx = x[i] - MX[Xi, Yi] / mc
+                dy = y[i] - MY[Xi, Yi] / mc
+                gx, gy = _repulsion_par(dx, dy, masa[i], mc, kr, None, None)
+                fx += np.bincount(i, weights=gx, minlength=n)
+                fy += np.bincount(i, weights=gy, minlength=n)
+
+    # campo cercano: pares exactos con las 3x3 celdas vecinas del nivel fino
+    orden = np.argsort(celda, kind="stable")
+    cnt = np.bincount(celda, minlength=lado * lado)
+    inicio = np.zeros(lado * lado, dtype=np.int64)
+    np.cumsum(cnt[:-1], out=inicio[1:])
+    puntos = np.arange(n, dtype=np.int64)
+    for ox in (-1, 0, 1):
+        for oy in (-1, 0, 1):
+            X, Y = cx + ox, cy + oy
+            ok = (X >= 0) & (X < lado) & (Y >= 0) & (Y < lado)
+            a = puntos[ok]
+            nc = X[ok] * lado + Y[ok]
+            reps = cnt[nc]
+            tot = int(reps.sum())
+            if tot == 0:
+                continue
+            a_rep = np.repeat(a, reps)
+            pos = np.repeat(inicio[nc] - np.cumsum(reps) + reps, reps) + np.arange(tot, dtype=np.int64)
+            b = orden[pos]
+            sel = a_rep != b
+            a_rep, b = a_rep[sel], b[sel]
+            ri = rj = None
+            if radio is not None:
+                ri, rj = radio[a_rep], radio[b]
+            gx, gy = _repulsion_par(x[a_rep] - x[b], y[a_rep] - y[b], masa[a_rep], masa[b], kr, ri, rj)
+            fx += np.bincount(a_rep, weights=gx, minlength=n)
+            fy += np.bincount(a_rep, weights=gy, minlength=n)
+    return fx, fy
+
+
+class ForceAtlas2:
+    """
+    Estado de ForceAtlas2 sobre un GrafoCSR (posiciones, velocidad global).
+    - paso(): una iteración (como goAlgo() de Gephi)
+    - correr(iters, tamanos=None): varias iteraciones; con tamanos activa
+      adjustSizes (los tamaños se usan como radio de cada nodo)
+    """
+
+    def __init__(self, g, seed: int = 1337, escala: float = 1000.0,
+                 scaling_ratio: float = 2.0, gravedad: float = 1.0, jitter: float = 1.0):
+        rng = np.random.default_rng(seed)
+        n = g.num_nodos
+        self.x = (rng.random(n) - 0.5) * escala
+        self.y = (rng.random(n) - 0.5) * escala
+        self.masa = grados(g).astype(np.float64) + 1.0
+        self.u, self.v = _arcos(g)
+        self.scaling_ratio = scaling_ratio
+        self.gravedad = gravedad
+        self.jitter = jitter
+        self._fx_ant = np.zeros(n)
+        self._fy_ant = np.zeros(n)
+        self._velocidad = 1.0
+        self._eficiencia = 1.0
+
+    def _fuerzas(self, radio: Optional[np.ndarray]):
+        x, y, masa = self.x, self.y, self.masa
+        n = x.size
+        if n <= EXACTO_MAX:
+            fx, fy = _repulsion_exacta(x, y, masa, self.scaling_ratio, radio)
+        else:
+            fx, fy = _repulsion_barnes_hut(x, y, masa, self.scaling_ratio, radio)
+
+        # gravedad hacia el origen (modo normal)
+        d = np.hypot(x, y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f = np.where(d > 0, self.gravedad * masa / d, 0.0)
+        fx -= x * f
+        fy -= y * f
+
+        # atracción lineal por arista (edgeWeightInfluence = 0, como el import de Gephi)
+        u, v = self.u, self.v
+        dx = x[u] - x[v]
+        dy = y[u] - y[v]
+        if radio is not None:
+            dd = np.hypot(dx, dy)
+            dp = dd - radio[u] - radio[v]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                c = np.where((dp > 0) & (dd > 0), dp / dd, 0.0)
+            dx, dy = dx * c, dy * c
+        fx += np.bincount(v, weights=dx, minlength=n) - np.bincount(u, weights=dx, minlength=n)
+        fy += np.bincount(v, weights=dy, minlength=n) - np.bincount(u, weights=dy, minlength=n)
+        return fx, fy
+
+    def paso(self, radio: Optional[np.ndarray] = None):
+        fx, fy = self._fuerzas(radio)
+        masa = self.masa
+        n = masa.size
+
+        # velocidad adaptativa global (swinging / traction) como en Gephi
+        swing = masa * np.hypot(fx - self._fx_ant, fy - self._fy_ant)
+        traccion = masa * 0.5 * np.hypot(fx + self._fx_ant, fy + self._fy_ant)
+        total_swing = float(swing.sum())
+        total_traccion = float(traccion.sum())
+
+        estimado = 0.05 * math.sqrt(n)
+        jt = self.jitter * max(math.sqrt(estimado), min(10.0, estimado * total_traccion / (n * n)))
+        if total_traccion > 0 and total_swing / total_traccion > 2.0:
+            if self._eficiencia > 0.05:
+                self._eficiencia *= 0.5
+            jt = max(jt, self.jitter)
+        objetivo = jt * self._eficiencia * total_traccion / total_swing if total_swing > 0 else self._velocidad
+        if total_swing > jt * total_traccion:
+            if self._eficiencia > 0.05:
+                self._eficiencia *= 0.7
+        elif self._velocidad < 1000:
+            self._eficiencia *= 1.3
+        self._velocidad += min(objetivo - self._velocidad, 0.5 * self._velocidad)
+
+        factor = self._velocidad / (1.0 + np.sqrt(self._velocidad * swing))
+        if radio is not None:
+            # con adjustSizes el desplazamiento se limita a 10 por iteración
+            df = np.hypot(fx, fy)
+            factor = 0.1 * factor
+            with np.errstate(divide="ignore", invalid="ignore"):
+                factor = np.where(df > 0, np.minimum(factor * df, 10.0) / df, 0.0)
+        self.x += fx * factor
+        self.y += fy * factor
+        self._fx_ant, self._fy_ant = fx, fy
+
+    def correr(self, iters: int, tamanos: Optional[np.ndarray] = None):
+        for _ in range(iters):
+            self.paso(tamanos)
+        return self.x, self.y
@@ -0,0 +1,157 @@
+# scripts/manifiesto.py
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from config_p3 import ROOT, W_MIN, W_MAX, modelos, parametros_modelo
+
+# Manifiesto de artefactos en outputs/: por cada trabajo (clave) guarda la
+# huella de sus entradas y los archivos que produjo. Un trabajo se salta si
+# la huella no cambió y sus salidas siguen en disco.
+
+MANIFIESTO = ROOT / "outputs" / "manifiesto.json"
+SCRIPTS = Path(__file__).resolve().parent
+
+
+def huella(*partes: Any) -> str:
+    """sha256 de las entradas (JSON canónico; lo no serializable va por repr)."""
+    txt = json.dumps(partes, sort_keys=True, default=repr, ensure_ascii=False)
+    return hashlib.sha256(txt.encode("utf-8")).hexdigest()
+
+
+def hash_archivo(path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for bloque in iter(lambda: f.read(1 << 20), b""):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def ruta_relativa(p) -> str:
+    """Ruta relativa a ROOT (como se guarda en el manifiesto)."""
+    p = Path(p).resolve()
+    try:
+        return p.relative_to(ROOT).as_posix()
+    except ValueError:
+        return str(p)
+
+
+@lru_cache(maxsize=None)
+def version_codigo(*archivos: str) -> str:
+    """
+    Versión del código de una etapa: hash del contenido de sus módulos.
+    Los nombres sin ruta se buscan en scripts/ ("grafo_dijkstra" -> grafo_dijkstra.py).
+    """
+    h = hashlib.sha256()
+    for a in archivos:
+        p = Path(a)
+        if not p.is_absolute():
+            p = SCRIPTS / (a if a.endswith(".py") else f"{a}.py")
+        h.update(p.name.encode("utf-8"))
+        h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+class Manifiesto:
+    """
+    outputs/manifiesto.json:
+        {"version": 1, "artefactos": {clave: {"huella": str, "salidas": [rutas]}}}
+    Las rutas se guardan relativas a ROOT.
+    - al_dia(clave, h): la huella coincide y todas las salidas existen
+    - registrar(clave, h, salidas) + guardar()
+    Con forzar=True al_dia() siempre es False (se rehace todo).
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Optional[Path] = None, forzar: bool = False):
+        self.path = Path(path) if path is not None else MANIFIESTO
+        self.forzar = forzar
+        self.artefactos: Dict[str, Dict[str, Any]] = self._leer()
+        self._cambios: Dict[str, Dict[str, Any]] = {}
+
+    def _leer(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                datos = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        if datos.get("version") != self.VERSION:
+            return {}
+        return datos.get("artefactos", {})
+
+    def al_dia(self, clave: str, h: str) -> bool:
+        if self.forzar:
+            return False
+        e = self.artefactos.get(clave)
+        if e is None or e.get("huella") != h:
+            return False
+        return all((ROOT / p).exists() for p in e.get("salidas", []))
+
+    def salidas(self, clave: str) -> List[str]:
+        e = self.artefactos.get(clave)
+        return [str(ROOT / p) for p in e["salidas"]] if e else []
+
+    def registrar(self, clave: str, h: str, salidas: Iterable):
+        e = {"huella": h, "salidas": [ruta_relativa(p) for p in salidas]}
+        self.artefactos[clave] = e
+        self._cambios[clave] = e
+
+    def guardar(self):
+        """
+        Escritura atómica. Se vuelve a leer el archivo y sólo se sobreescriben
+        las claves registradas aquí (otra etapa pudo guardar mientras tanto).
+        """
+        if not self._cambios:
+            return
+        artefactos = self._leer()
+        artefactos.update(self._cambios)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "artefactos": artefactos}, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+        self.artefactos = artefactos
+        self._cambios = {}
+
+
+# ----------------------------------------------------------------------
+# Huellas de las etapas de generación
+# ----------------------------------------------------------------------
+# pipeline.py tiene la construcción y el export (grafo_pesado, exportar_*,
+# choose_source_id) que usan también los scripts generar_*.py
+CODIGO_GENERADOS = ("config_p3", "grafo_dijkstra", "export_gv_pesos", "pipeline")
+CODIGO_DIJKSTRA = CODIGO_GENERADOS + ("resultado_spt", "colas", "motores_sssp")
+
+
+def _codigo_p1() -> tuple:
+    # la biblioteca del Proyecto 1 también es entrada (generadores y Grafo)
+    src = Path(modelos.__file__).resolve().parent
+    return tuple(str(p) for p in (src / "modelos.py", src / "grafo.py") if p.exists())
+
+
+def _entradas(modelo: str, n: int, seed_base: int, seed_w: int) -> Dict[str, Any]:
+    return {
+        "modelo": modelo,
+        "n": n,
+        "seed_base": seed_base,
+        "seed_pesos": seed_w,
+        "w": [W_MIN, W_MAX],
+        "parametros": parametros_modelo(modelo, n),
+    }
+
+
+def huella_generados(modelo: str, n: int, seed_base: int, seed_w: int) -> str:
+    return huella("generados", _entradas(modelo, n, seed_base, seed_w),
+                  version_codigo(*CODIGO_GENERADOS, *_codigo_p1()))
+
+
+def huella_dijkstra(modelo: str, n: int, seed_base: int, seed_w: int) -> str:
+    # la fuente la decide choose_source_id (pipeline.py, parte del código)
+    return huella("dijkstra", _entradas(modelo, n, seed_base, seed_w),
+                  version_codigo(*CODIGO_DIJKSTRA, *_codigo_p1()))
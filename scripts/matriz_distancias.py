@@ -0,0 +1,145 @@
+# scripts/matriz_distancias.py
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from grafo_csr import GrafoCSR
+from memoria_compartida import adjuntar, publicar
+
+
+# Grafo compilado del proceso worker (se recibe una sola vez en el initializer)
+_G: Optional[GrafoCSR] = None
+
+
+def _init_worker(g: GrafoCSR):
+    global _G
+    _G = g
+
+
+def _init_worker_compartido(nombre: str):
+    # ids densos: _bloque sólo usa índices
+    global _G
+    _G = adjuntar(nombre, con_ids=False)
+
+
+def _bloque(g: GrafoCSR, fuentes: Sequence[int], destinos: Optional[np.ndarray], predecesores: bool):
+    """Corre Dijkstra por cada índice fuente y regresa las filas del bloque."""
+    n_cols = g.num_nodos if destinos is None else len(destinos)
+    D = np.empty((len(fuentes), n_cols), dtype=np.float64)
+    P = np.empty((len(fuentes), n_cols), dtype=np.int64) if predecesores else None
+
+    for f, s_i in enumerate(fuentes):
+        dist, parent = g.dijkstra(g.ids[s_i])
+        d = np.frombuffer(dist, dtype=np.float64)
+        D[f] = d if destinos is None else d[destinos]
+        if predecesores:
+            p = np.frombuffer(parent, dtype=np.int64)
+            P[f] = p if destinos is None else p[destinos]
+    return D, P
+
+
+def _tarea(args):
+    return _bloque(_G, *args)
+
+
+def _compilar(g) -> GrafoCSR:
+    return g if isinstance(g, GrafoCSR) else g.compile()
+
+
+def iter_bloques_distancias(
+    g,
+    fuentes: Sequence,
+    destinos: Optional[Sequence] = None,
+    predecesores: bool = False,
+    workers: Optional[int] = None,
+    filas_por_bloque: int = 32,
+    compartida: bool = False,
+) -> Iterator[Tuple[int, np.ndarray, Optional[np.ndarray]]]:
+    """
+    Calcula la matriz de distancias por bloques de filas, en orden.
+    - g: GrafoDijkstra o GrafoCSR
+    - fuentes / destinos: ids originales (destinos=None -> todos los nodos)
+    - predecesores=True agrega la matriz de padres (índices densos de g.compile(),
+      -1 si no hay padre)
+    - workers: procesos del pool (None -> os.cpu_count(); 1 -> sin pool)
+    Produce: (fila_inicial, D_bloque, P_bloque o None)
+
+    Cada worker recibe el grafo una sola vez y sólo hay ~2 bloques por
+    worker en vuelo, así que la memoria no depende del número de fuentes.
+    Con compartida=True el grafo se publica en memoria compartida y los
+    workers se adjuntan por nombre en vez de recibir una copia
+    (ver memoria_compartida.py).
+    """
+    csr = _compilar(g)
+    idx_f = [csr.indice_de(s) for s in fuentes]
+    idx_d = None if destinos is None else np.array([csr.indice_de(t) for t in destinos], dtype=np.int64)
+
+    tareas = [
+        (i, (idx_f[i:i + filas_por_bloque], idx_d, predecesores))
+        for i in range(0, len(idx_f), filas_por_bloque)
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tareas) <= 1:
+        for inicio, args in tareas:
+            D, P = _bloque(csr, *args)
+            yield inicio, D, P
+        return
+
+    if compartida:
+        with publicar(csr) as pub:
+            yield from _en_pool(tareas, workers, _init_worker_compartido, (pub.nombre,))
+    else:
+        yield from _en_pool(tareas, workers, _init_worker, (csr,))
+
+
+def _en_pool(tareas, workers: int, initializer, initargs):
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as ex:
+        it = iter(tareas)
+        pendientes = deque()
+
+        def encolar():
+            sig = next(it, None)
+            if sig is not None:
+                pendientes.append((sig[0], ex.submit(_tarea, sig[1])))
+
+        for _ in range(2 * workers):
+            encolar()
+        while pendientes:
+            inicio, fut = pendientes.popleft()
+            D, P = fut.result()
+            encolar()
+            yield inicio, D, P
+
+
+def matriz_distancias(
+    g,
+    fuentes: Sequence,
+    destinos: Optional[Sequence] = None,
+    predecesores: bool = False,
+    workers: Optional[int] = None,
+    filas_por_bloque: int = 32,
+    compartida: bool = False,
+):
+    """
+    Matriz densa de distancias |fuentes| x |destinos| (np.inf si no alcanzable).
+    Regresa D, o (D, P) si predecesores=True. Ver iter_bloques_distancias.
+    """
+    csr = _compilar(g)
+    n_cols = csr.num_nodos if destinos is None else len(destinos)
+    D = np.empty((len(fuentes), n_cols), dtype=np.float64)
+    P = np.empty((len(fuentes), n_cols), dtype=np.int64) if predecesores else None
+
+    for inicio, D_b, P_b in iter_bloques_distancias(
+        csr, fuentes, destinos, predecesores, workers, filas_por_bloque, compartida
+    ):
+        D[inicio:inicio + len(D_b)] = D_b
+        if predecesores:
+            P[inicio:inicio + len(P_b)] = P_b
+
+    return (D, P) if predecesores else D
@@ -0,0 +1,103 @@
+# scripts/memoria_compartida.py
+from __future__ import annotations
+
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Optional
+
+from formato_binario import desde_buffer, escribir_en, tamano_binario
+from grafo_csr import GrafoCSR
+
+# Grafo congelado publicado en multiprocessing.shared_memory con el mismo
+# layout que un .gdb (ver formato_binario.py). El proceso que publica es
+# dueño del bloque; los workers se adjuntan por nombre y leen la misma
+# memoria física: no se serializa _nodos ni _w por worker, así que el
+# arranque y la RSS de cada worker no dependen del número de workers.
+#
+#   with publicar(g) as pub:
+#       ProcessPoolExecutor(initializer=init_worker, initargs=(pub.nombre,))
+#
+# En el worker: grafo_worker() regresa el GrafoCSR adjuntado.
+
+# Bloques adjuntados en este proceso (deben vivir mientras haya vistas)
+_ADJUNTOS: Dict[str, SharedMemory] = {}
+# Grafo del proceso worker (init_worker)
+_G: Optional[GrafoCSR] = None
+
+
+class GrafoPublicado:
+    """
+    Bloque de memoria compartida con un GrafoCSR. Es dueño del bloque:
+    liberar() (o salir del with) lo cierra y lo elimina del sistema.
+    """
+
+    def __init__(self, g, nombre: Optional[str] = None):
+        csr = g if isinstance(g, GrafoCSR) else g.compile()
+        self._shm = SharedMemory(name=nombre, create=True, size=max(1, tamano_binario(csr)))
+        escribir_en(csr, self._shm.buf)
+        self.nombre = self._shm.name
+        self.num_bytes = self._shm.size
+
+    def liberar(self):
+        """
+        Elimina el bloque. Los workers que sigan adjuntados conservan su
+        mapeo hasta terminar; el sistema libera la memoria al final.
+        """
+        if self._shm is None:
+            return
+        self._shm.unlink()
+        try:
+            self._shm.close()
+        except BufferError:
+            pass  # quedan vistas vivas en este proceso; se cierra al soltarlas
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.liberar()
+
+
+def publicar(g, nombre: Optional[str] = None) -> GrafoPublicado:
+    """Publica g (GrafoDijkstra -> compile(), o GrafoCSR) en memoria compartida."""
+    return GrafoPublicado(g, nombre)
+
+
+def _abrir(nombre: str) -> SharedMemory:
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=nombre, track=False)
+    # antes de 3.13 adjuntarse también registra el bloque en el resource
+    # tracker (compartido con el dueño), que lo borraría al salir el worker:
+    # sólo el dueño lo registra y lo elimina
+    registrar = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return SharedMemory(name=nombre)
+    finally:
+        resource_tracker.register = registrar
+
+
+def adjuntar(nombre: str, con_ids: bool = True) -> GrafoCSR:
+    """
+    GrafoCSR de sólo lectura sobre el bloque publicado (sin copias).
+    con_ids=False usa índices densos como ids (range(n)) y no decodifica
+    la lista de ids originales: la memoria propia del worker queda en O(1).
+    """
+    shm = _ADJUNTOS.get(nombre)
+    if shm is None:
+        shm = _ADJUNTOS[nombre] = _abrir(nombre)
+    return desde_buffer(shm.buf, con_ids=con_ids)
+
+
+def init_worker(nombre: str, con_ids: bool = True):
+    """initializer para ProcessPoolExecutor / multiprocessing.Pool."""
+    global _G
+    _G = adjuntar(nombre, con_ids=con_ids)
+
+
+def grafo_worker() -> GrafoCSR:
+    if _G is None:
+        raise RuntimeError("El worker no se adjuntó a un grafo (falta init_worker)")
+    return _G
@@ -0,0 +1,171 @@
+# scripts/motores_sssp.py
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import math
+import time
+from typing import Callable, Dict, List, Optional
+
+from config_p3 import MODELOS  # antes que grafo_csr/resultado_spt: pone la biblioteca del P1 en sys.path
+from grafo_csr import GrafoCSR
+from resultado_spt import ResultadoSPT
+
+# Registro de motores de caminos más cortos desde una fuente (SSSP).
+# Un motor es fn(g, s) -> ResultadoSPT con dist/parent por id original,
+# así que cualquiera respeta el contrato de Dijkstra(s) (incluido T, dist = ...).
+#   - "heap":  dijkstra_heap, la implementación de referencia (Python puro)
+#   - "csr":   GrafoCSR.dijkstra sobre g.compile()
+#   - "scipy": scipy.sparse.csgraph.dijkstra sobre los mismos buffers CSR
+#              (sólo si SciPy está instalado)
+# GrafoDijkstra.Dijkstra(s, motor=...) despacha aquí; validar(...) corre dos
+# motores sobre el mismo (g, s) y compara las distancias.
+
+Motor = Callable[..., ResultadoSPT]
+
+TOLERANCIA_DEFAULT = 1e-9  # relativa y absoluta (math.isclose)
+
+
+def _heap(g, s) -> ResultadoSPT:
+    from grafo_dijkstra import dijkstra_heap
+
+    return dijkstra_heap(g, s)
+
+
+def _compilado(g) -> GrafoCSR:
+    return g if isinstance(g, GrafoCSR) else g.compile()
+
+
+def _csr(g, s) -> ResultadoSPT:
+    csr = _compilado(g)
+    dist, parent = csr.dijkstra(s)
+    return ResultadoSPT(g, s, csr.dist_dict(dist), csr.parent_dict(parent))
+
+
+def _scipy(g, s) -> ResultadoSPT:
+    import numpy as np
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra
+
+    csr = _compilado(g)
+    n = csr.num_nodos
+    # vistas de los buffers (sin copia); el CSR ya trae ambos sentidos en
+    # grafos no dirigidos, así que para csgraph siempre es dirigido
+    A = csr_matrix(
+        (
+            np.asarray(csr.pesos, dtype=np.float64),
+            np.asarray(csr.destinos, dtype=np.int64),
+            np.asarray(csr.offsets, dtype=np.int64),
+        ),
+        shape=(n, n),
+    )
+    dist, pred = dijkstra(A, directed=True, indices=csr.indice_de(s), return_predecessors=True)
+    # csgraph marca "sin padre" con -9999: cualquier negativo -> None
+    return ResultadoSPT(g, s, csr.dist_dict(dist), csr.parent_dict(pred.tolist()))
+
+
+MOTORES: Dict[str, Motor] = {"heap": _heap, "csr": _csr}
+
+
+def _hay_scipy() -> bool:
+    # sólo el paquete raíz: buscar scipy.sparse.csgraph ya importaría scipy
+    # (y numpy) al importar GrafoDijkstra; los imports van dentro de _scipy
+    return importlib.util.find_spec("scipy") is not None
+
+
+if _hay_scipy():
+    MOTORES["scipy"] = _scipy
+
+
+def registrar_motor(nombre: str, fn: Motor):
+    """Agrega (o reemplaza) un motor: fn(g, s) -> ResultadoSPT."""
+    MOTORES[nombre] = fn
+
+
+def motores_disponibles() -> List[str]:
+    return list(MOTORES)
+
+
+def obtener_motor(nombre: str) -> Motor:
+    fn = MOTORES.get(nombre)
+    if fn is None:
+        extra = " (requiere SciPy)" if nombre == "scipy" else ""
+        raise ValueError(
+            f"Motor desconocido: {nombre}{extra} (opciones: {', '.join(MOTORES)})"
+        )
+    return fn
+
+
+def diferencias(a: ResultadoSPT, b: ResultadoSPT, tol: float = TOLERANCIA_DEFAULT) -> List[tuple]:
+    """
+    Nodos donde las distancias difieren más de tol: [(v, dist_a, dist_b)].
+    Los padres no se comparan (con empates cada motor puede elegir otro).
+    """
+    malos = []
+    db = b.dist
+    for v, da in a.dist.items():
+        d = db.get(v)
+        if d is None or not (da == d or math.isclose(da, d, rel_tol=tol, abs_tol=tol)):
+            malos.append((v, da, d))
+    malos.extend((v, None, d) for v, d in db.items() if v not in a.dist)
+    return malos
+
+
+def validar(g, s, motor: str = "scipy", referencia: str = "heap", tol: float = TOLERANCIA_DEFAULT) -> ResultadoSPT:
+    """
+    Corre motor y referencia sobre el mismo (g, s) y lanza AssertionError
+    si alguna distancia difiere más de tol. Regresa el resultado de motor.
+    """
+    res = obtener_motor(motor)(g, s)
+    ref = obtener_motor(referencia)(g, s)
+    malos = diferencias(res, ref, tol)
+    if malos:
+        muestra = ", ".join(f"{v}: {da} vs {db}" for v, da, db in malos[:5])
+        raise AssertionError(
+            f"{motor} y {referencia} difieren en {len(malos)} nodo(s) desde s={s} "
+            f"(tol={tol}): {muestra}"
+        )
+    return res
+
+
+# ----------------------------------------------------------------------
+# CLI: valida y mide los motores sobre los grafos del pipeline
+# ----------------------------------------------------------------------
+def main(
+    motores: Optional[List[str]] = None,
+    referencia: str = "heap",
+    tol: float = TOLERANCIA_DEFAULT,
+    modelos: Optional[List[str]] = None,
+):
+    from pipeline import choose_source_id, grafo_pesado, trabajos
+
+    motores = motores or motores_disponibles()
+    modelos = modelos or MODELOS
+    for modelo, tag, n, seed_base, seed_w in trabajos():
+        if modelo not in modelos:
+            continue
+        g = grafo_pesado(modelo, n, seed_base, seed_w)
+        s = choose_source_id(g)
+        g.compile()  # no se cuenta en el tiempo de los motores CSR
+        ref = obtener_motor(referencia)(g, s)
+        tiempos = []
+        for m in motores:
+            t0 = time.perf_counter()
+            res = obtener_motor(m)(g, s)
+            tiempos.append(f"{m}={time.perf_counter() - t0:.4f}s")
+            malos = diferencias(res, ref, tol)
+            if malos:
+                raise AssertionError(f"{modelo} {tag}: {m} y {referencia} difieren en {len(malos)} nodo(s)")
+        print(f"[ok] {modelo} {tag} n={n} s={s}: " + " ".join(tiempos))
+
+    print(f"Listo: los motores coinciden con {referencia} (tol={tol}).")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compara los motores SSSP contra el de referencia.")
+    parser.add_argument("--motores", nargs="+", default=None, help=f"default: {' '.join(MOTORES)}")
+    parser.add_argument("--referencia", default="heap")
+    parser.add_argument("--tol", type=float, default=TOLERANCIA_DEFAULT)
+    parser.add_argument("--modelos", nargs="+", choices=MODELOS, default=None, help="default: todos")
+    args = parser.parse_args()
+    main(motores=args.motores, referencia=args.referencia, tol=args.tol, modelos=args.modelos)
@@ -0,0 +1,98 @@
+# scripts/pesos.py
+from __future__ import annotations
+
+import hashlib
+from typing import Tuple
+
+import numpy as np
+
+# Generadores vectorizados de pesos para GrafoDijkstra.asignar_pesos(...).
+# Cada generador regresa un np.ndarray alineado con g.aristas().
+# El número aleatorio de una arista sale de hash(seed, extremos): no depende
+# del orden de iteración ni de cómo se reparta el trabajo entre procesos.
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _hash_id(nid) -> int:
+    # repr es estable entre corridas (a diferencia de hash() para str)
+    return int.from_bytes(hashlib.blake2b(repr(nid).encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _extremos(g) -> Tuple[np.ndarray, np.ndarray]:
+    """Hash de 64 bits del origen y del destino de cada arista, en orden de g.aristas()."""
+    h = {n.id: _hash_id(n.id) for n in g.nodos()}
+    aristas = g.aristas()
+    hu = np.fromiter((h[a.origen.id] for a in aristas), dtype=np.uint64, count=len(aristas))
+    hv = np.fromiter((h[a.destino.id] for a in aristas), dtype=np.uint64, count=len(aristas))
+    return hu, hv
+
+
+def hash_aristas(g, seed: int) -> np.ndarray:
+    """
+    Entero de 64 bits por arista = f(seed, extremos). En grafos no dirigidos
+    es simétrico (u, v) ~ (v, u).
+    """
+    hu, hv = _extremos(g)
+    if not g.dirigido:
+        hu, hv = np.minimum(hu, hv), np.maximum(hu, hv)
+    with np.errstate(over="ignore"):
+        s = _splitmix64(np.array([seed & 0xFFFFFFFFFFFFFFFF], dtype=np.uint64))
+        return _splitmix64(s ^ _splitmix64(hu) ^ (_splitmix64(hv) * np.uint64(0x2545F4914F6CDD1D)))
+
+
+def _unif01(g, seed: int) -> np.ndarray:
+    """Uniforme en [0, 1) por arista (53 bits de mantisa)."""
+    return (hash_aristas(g, seed) >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def pesos_uniformes(g, w_min: float, w_max: float, seed: int) -> np.ndarray:
+    """Pesos reales uniformes en [w_min, w_max)."""
+    return w_min + (w_max - w_min) * _unif01(g, seed)
+
+
+def pesos_enteros(g, w_min: int, w_max: int, seed: int) -> np.ndarray:
+    """Pesos enteros uniformes en [w_min, w_max] (como float, para Dial/radix)."""
+    rango = int(w_max) - int(w_min) + 1
+    return (int(w_min) + np.floor(_unif01(g, seed) * rango)).astype(np.float64)
+
+
+def pesos_euclidianos(g, escala: float = 1.0, minimo: float = 1e-9) -> np.ndarray:
+    """
+    escala * longitud euclidiana de cada arista (requiere x/y en los nodos).
+    Las aristas de longitud 0 reciben minimo (Dijkstra exige pesos > 0).
+    """
+    aristas = g.aristas()
+    coords = np.array(
+        [(a.origen.x, a.origen.y, a.destino.x, a.destino.y) for a in aristas],
+        dtype=np.float64,
+    ).reshape(-1, 4)
+    if np.isnan(coords).any():
+        raise ValueError("pesos_euclidianos requiere coordenadas x/y en todos los nodos")
+    largo = np.hypot(coords[:, 0] - coords[:, 2], coords[:, 1] - coords[:, 3])
+    return np.maximum(escala * largo, minimo)
+
+
+def pesos_por_grado(g, modo: str = "promedio") -> np.ndarray:
+    """
+    Peso a partir del grado de los extremos:
+    - "promedio": (grado(u) + grado(v)) / 2  (los hubs son caros)
+    - "inverso": 2 / (grado(u) + grado(v))   (los hubs son baratos)
+    """
+    grado = {n.id: len(g.vecinos(n.id)) for n in g.nodos()}
+    aristas = g.aristas()
+    suma = np.fromiter(
+        (grado[a.origen.id] + grado[a.destino.id] for a in aristas),
+        dtype=np.float64,
+        count=len(aristas),
+    )
+    if modo == "promedio":
+        return suma / 2.0
+    if modo == "inverso":
+        return 2.0 / suma
+    raise ValueError(f"Modo desconocido: {modo}")
@@ -0,0 +1,116 @@
+# scripts/pipeline.py
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional, Tuple
+
+from config_p3 import (
+    ROOT,
+    W_MIN, W_MAX,
+    MODELOS, TAMANOS,
+    build_base_graph,
+)
+from grafo_dijkstra import GrafoDijkstra
+from export_gv_pesos import export_graphviz
+from manifiesto import Manifiesto, huella_dijkstra, huella_generados
+
+
+# (modelo, tag, n, seed_base, seed_pesos)
+Trabajo = Tuple[str, str, int, int, int]
+
+
+def trabajos() -> List[Trabajo]:
+    return [(modelo, *tam) for modelo in MODELOS for tam in TAMANOS]
+
+
+def grafo_pesado(modelo: str, n: int, seed_base: int, seed_w: int) -> GrafoDijkstra:
+    """Grafo base del modelo + pesos uniformes (igual que los scripts generar_*)."""
+    base = build_base_graph(modelo, n, seed_base)
+    g = GrafoDijkstra.from_grafo(base)
+    g.asignar_pesos_uniformes(W_MIN, W_MAX, seed=seed_w)
+    return g
+
+
+def choose_source_id(g: GrafoDijkstra):
+    # fuente: primer nodo del grafo (determinístico por construcción del modelo)
+    return g.nodos()[0].id
+
+
+def exportar_generado(g: GrafoDijkstra, modelo: str, tag: str, n: int) -> str:
+    """outputs/gv/generados/<modelo>/<modelo>_<tag>_n<n>.gv (con pesos)."""
+    path = ROOT / "outputs" / "gv" / "generados" / modelo / f"{modelo}_{tag}_n{n}.gv"
+    export_graphviz(g, str(path), peso_fn=g.peso_arista)
+    return str(path)
+
+
+def exportar_dijkstra(g: GrafoDijkstra, modelo: str, tag: str, n: int) -> Tuple[str, Any]:
+    """
+    Árbol Dijkstra desde choose_source_id(g) en
+    outputs/gv/dijkstra/<modelo>/<modelo>_<tag>_n<n>_dijkstra_s<s>.gv.
+    Regresa (ruta, s).
+    """
+    s = choose_source_id(g)
+    res = g.Dijkstra(s)
+    path = ROOT / "outputs" / "gv" / "dijkstra" / modelo / f"{modelo}_{tag}_n{n}_dijkstra_s{s}.gv"
+    export_graphviz(res.as_grafo(), str(path), peso_fn=None)
+    return str(path), s
+
+
+def procesar(trabajo: Trabajo) -> List[str]:
+    """
+    Construye el grafo de un (modelo, tamaño) una sola vez y escribe el
+    grafo generado y su árbol Dijkstra. Regresa las rutas escritas.
+    """
+    modelo, tag, n, seed_base, seed_w = trabajo
+    g = grafo_pesado(modelo, n, seed_base, seed_w)
+    path_g = exportar_generado(g, modelo, tag, n)
+    path_d, _ = exportar_dijkstra(g, modelo, tag, n)
+    return [path_g, path_d]
+
+
+def _claves(trabajo: Trabajo) -> List[Tuple[str, str]]:
+    """(clave, huella) de los dos artefactos del trabajo, como en generar_*.py."""
+    modelo, tag, n, seed_base, seed_w = trabajo
+    return [
+        (f"generados/{modelo}/{tag}", huella_generados(modelo, n, seed_base, seed_w)),
+        (f"dijkstra/{modelo}/{tag}", huella_dijkstra(modelo, n, seed_base, seed_w)),
+    ]
+
+
+def main(workers: Optional[int] = None, forzar: bool = False):
+    """
+    Punto de entrada único de generar_grafos_pesados + generar_dijkstra:
+    cada (modelo, tamaño) es un trabajo independiente en un pool de procesos.
+    Los scripts por separado usan las mismas funciones (grafo_pesado,
+    exportar_*), así que las salidas son idénticas byte a byte.
+    Los trabajos cuyas entradas no cambiaron (ver manifiesto.py) se saltan;
+    si no queda ninguno no se levanta el pool.
+    """
+    manifiesto = Manifiesto(forzar=forzar)
+    pendientes = []
+    for t in trabajos():
+        claves = _claves(t)
+        if all(manifiesto.al_dia(c, h) for c, h in claves):
+            for c, _ in claves:
+                print(f"[=] {manifiesto.salidas(c)[0]} (sin cambios)")
+        else:
+            pendientes.append((t, claves))
+
+    if pendientes:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            for (t, claves), paths in zip(pendientes, ex.map(procesar, [t for t, _ in pendientes])):
+                for (c, h), p in zip(claves, paths):
+                    manifiesto.registrar(c, h, [p])
+                    print(f"[OK] {p}")
+        manifiesto.guardar()
+
+    print("Listo: grafos generados con pesos y árboles Dijkstra exportados.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera grafos pesados y árboles Dijkstra en paralelo.")
+    parser.add_argument("--workers", type=int, default=None, help="procesos (default: núcleos)")
+    parser.add_argument("--forzar", action="store_true", help="ignora el manifiesto y regenera todo")
+    args = parser.parse_args()
+    main(workers=args.workers, forzar=args.forzar)
@@ -0,0 +1,358 @@
+# scripts/render_grafos.py
+from __future__ import annotations
+
+import argparse
+import io
+import math
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config_p3 import ROOT
+from import_gv_pesos import import_graphviz
+from layout_fa2 import ForceAtlas2, grados
+from manifiesto import Manifiesto, hash_archivo, huella, ruta_relativa, version_codigo
+
+# Etapa de visualización sin Gephi (reemplaza gephi_batch_export*.py):
+#   outputs/gv/{generados,dijkstra}/<modelo>/*.gv
+#     -> outputs/img/{generados,dijkstra}/<modelo>/*.svg / *.pdf
+# Mismo flujo que el script de Gephi: posiciones al azar, FA2 sin prevent
+# overlap, ranking grado -> tamaño, FA2 con prevent overlap. Si el .gv trae
+# pos="x,y!" (Geografico) se usan esas coordenadas y no se corre FA2.
+# Tamaños y labels dependen de la categoría, como en process_dir (ESTILOS).
+
+# Lienzo
+ANCHO = 2400
+ALTO = 1600
+MARGEN = 40
+
+# Layout (mismos valores que gephi_batch_export.py)
+FA2_ITERS_1 = 400
+FA2_ITERS_2 = 400
+SEED_LAYOUT = 1337
+ESCALA_LAYOUT = 1000.0
+
+# Tamaños de nodo
+MIN_NODE_SIZE = 5.0
+MAX_NODE_SIZE = 40.0
+
+# Por categoría (igual que gephi_batch_export.process_dir):
+# - generados: ranking grado -> 5..40, sólo labels de aristas (pesos)
+# - dijkstra: tamaño uniforme 10, sólo labels de nodos ("id (dist)")
+ESTILOS = {
+    "generados": {"tamanos": (MIN_NODE_SIZE, MAX_NODE_SIZE), "labels_nodos": False, "labels_aristas": True},
+    "dijkstra": {"tamanos": (10.0, 10.0), "labels_nodos": True, "labels_aristas": False},
+}
+
+# Arriba de esto no se dibujan labels (saturan la imagen, ver README)
+ETIQUETAS_MAX = 100
+
+COLOR_NODO = (0.6, 0.6, 0.6)
+COLOR_ARISTA = (0.55, 0.55, 0.55)
+COLOR_TEXTO = (0.0, 0.0, 0.0)
+
+FORMATOS = ("svg", "pdf")
+
+
+def ranking_grado_tamano(g, min_size: float = MIN_NODE_SIZE, max_size: float = MAX_NODE_SIZE) -> np.ndarray:
+    """
+    Igual que apply_degree_size_ranking (Gephi):
+    size = min_size + (deg - deg_min)/(deg_max-deg_min) * (max_size-min_size)
+    """
+    grado = grados(g).astype(np.float64)
+    if grado.size == 0:
+        return grado
+    deg_min, deg_max = grado.min(), grado.max()
+    denom = (deg_max - deg_min) if deg_max != deg_min else 1.0
+    return min_size + (grado - deg_min) / denom * (max_size - min_size)
+
+
+def layout(g, iteraciones: Tuple[int, int] = (FA2_ITERS_1, FA2_ITERS_2), seed: int = SEED_LAYOUT,
+           usar_coordenadas: bool = True, rango_tamanos: Tuple[float, float] = (MIN_NODE_SIZE, MAX_NODE_SIZE)):
+    """Regresa (x, y, tamanos) en unidades de layout."""
+    tamanos = ranking_grado_tamano(g, *rango_tamanos)
+    if usar_coordenadas and g.num_nodos and g.tiene_coordenadas():
+        x = np.asarray(g.xs, dtype=np.float64) * ESCALA_LAYOUT
+        y = np.asarray(g.ys, dtype=np.float64) * ESCALA_LAYOUT
+        return x, y, tamanos
+
+    fa2 = ForceAtlas2(g, seed=seed, escala=ESCALA_LAYOUT)
+    fa2.correr(iteraciones[0])
+    fa2.correr(iteraciones[1], tamanos / 2.0)
+    return fa2.x, fa2.y, tamanos
+
+
+# ----------------------------------------------------------------------
+# Primitivas de dibujo (en coordenadas del lienzo, y hacia abajo)
+# ----------------------------------------------------------------------
+def _a_lienzo(x, y, tamanos):
+    """Transformación uniforme layout -> lienzo (posiciones y radios juntos)."""
+    r = tamanos / 2.0
+    if x.size == 0:
+        return x, y, r
+    x0, x1 = float((x - r).min()), float((x + r).max())
+    y0, y1 = float((y - r).min()), float((y + r).max())
+    esc = min((ANCHO - 2 * MARGEN) / ((x1 - x0) or 1.0), (ALTO - 2 * MARGEN) / ((y1 - y0) or 1.0))
+    dx = (ANCHO - esc * (x1 - x0)) / 2.0
+    dy = (ALTO - esc * (y1 - y0)) / 2.0
+    # en Gephi y crece hacia arriba
+    return dx + (x - x0) * esc, ALTO - (dy + (y - y0) * esc), r * esc
+
+
+def _primitivas(g, X, Y, R, labels_nodos: bool, labels_aristas: bool) -> Iterator[tuple]:
+    """
+    ("curva", x1, y1, cx, cy, x2, y2) / ("linea", x1, y1, x2, y2),
+    ("flecha", [(x, y)] * 3), ("circulo", x, y, r), ("texto", x, y, tam, txt).
+    Igual que la Preview del script de Gephi: aristas curvas en grafos
+    generados; rectas y con flecha en árboles (dirigidos).
+    """
+    offsets = np.asarray(g.offsets, dtype=np.int64)
+    u = np.repeat(np.arange(g.num_nodos, dtype=np.int64), np.diff(offsets))
+    v = np.asarray(g.destinos, dtype=np.int64)
+    w = np.asarray(g.pesos, dtype=np.float64)
+    if not g.dirigido:
+        sel = u < v
+        u, v, w = u[sel], v[sel], w[sel]
+
+    for a, b in zip(u.tolist(), v.tolist()):
+        x1, y1, x2, y2 = X[a], Y[a], X[b], Y[b]
+        if g.dirigido:
+            yield ("linea", x1, y1, x2, y2)
+            d = math.hypot(x2 - x1, y2 - y1)
+            if d > R[b]:
+                ux, uy = (x2 - x1) / d, (y2 - y1) / d
+                px, py = x2 - ux * R[b], y2 - uy * R[b]
+                largo, ancho = 10.0, 4.0
+                bx, by = px - ux * largo, py - uy * largo
+                yield ("flecha", [(px, py), (bx - uy * ancho, by + ux * ancho), (bx + uy * ancho, by - ux * ancho)])
+        else:
+            # control desplazado perpendicularmente (curva en sentido horario)
+            mx, my = (x1 + x2) / 2.0, (y1 + y2) / 2.0
+            yield ("curva", x1, y1, mx + (y2 - y1) * 0.2, my - (x2 - x1) * 0.2, x2, y2)
+
+    for i in range(g.num_nodos):
+        yield ("circulo", X[i], Y[i], R[i])
+
+    # edge labels sólo si hay pesos (los árboles se exportan sin label)
+    if labels_aristas and w.size and not np.all(w == 1.0):
+        for a, b, p in zip(u.tolist(), v.tolist(), w.tolist()):
+            yield ("texto", (X[a] + X[b]) / 2.0, (Y[a] + Y[b]) / 2.0, 14, f"{p:.2f}")
+    if labels_nodos:
+        for i, nid in enumerate(g.ids):
+            yield ("texto", X[i], Y[i], 20, str(nid))
+
+
+def _escapar_xml(txt: str) -> str:
+    return txt.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+def _rgb(c) -> str:
+    return "rgb({},{},{})".format(*(int(round(255 * k)) for k in c))
+
+
+def escribir_svg(primitivas, path: Path):
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{ANCHO}" height="{ALTO}" '
+                f'viewBox="0 0 {ANCHO} {ALTO}">\n')
+        f.write('<rect width="100%" height="100%" fill="white"/>\n')
+        f.write(f'<g fill="none" stroke="{_rgb(COLOR_ARISTA)}" stroke-width="1">\n')
+        abierto = "aristas"
+        for p in primitivas:
+            tipo = p[0]
+            if tipo == "circulo" and abierto != "nodos":
+                f.write(f'</g>\n<g fill="{_rgb(COLOR_NODO)}" stroke="black" stroke-width="0.5">\n')
+                abierto = "nodos"
+            elif tipo == "texto" and abierto != "texto":
+                f.write(f'</g>\n<g font-family="Arial, Helvetica, sans-serif" fill="{_rgb(COLOR_TEXTO)}" '
+                        f'stroke="white" stroke-width="1" paint-order="stroke" text-anchor="middle" '
+                        f'dominant-baseline="central">\n')
+                abierto = "texto"
+
+            if tipo == "linea":
+                f.write(f'<line x1="{p[1]:.2f}" y1="{p[2]:.2f}" x2="{p[3]:.2f}" y2="{p[4]:.2f}"/>\n')
+            elif tipo == "curva":
+                f.write(f'<path d="M{p[1]:.2f},{p[2]:.2f} Q{p[3]:.2f},{p[4]:.2f} {p[5]:.2f},{p[6]:.2f}"/>\n')
+            elif tipo == "flecha":
+                pts = " ".join(f"{x:.2f},{y:.2f}" for x, y in p[1])
+                f.write(f'<polygon points="{pts}" fill="{_rgb(COLOR_ARISTA)}" stroke="none"/>\n')
+            elif tipo == "circulo":
+                f.write(f'<circle cx="{p[1]:.2f}" cy="{p[2]:.2f}" r="{p[3]:.2f}"/>\n')
+            else:
+                f.write(f'<text x="{p[1]:.2f}" y="{p[2]:.2f}" font-size="{p[3]}">{_escapar_xml(p[4])}</text>\n')
+        f.write("</g>\n</svg>\n")
+
+
+def _escapar_pdf(txt: str) -> bytes:
+    b = txt.encode("latin-1", errors="replace")
+    return b.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def escribir_pdf(primitivas, path: Path):
+    """PDF de una página (Helvetica, contenido comprimido), sin dependencias."""
+    k = 0.5523  # aproximación de un cuarto de círculo con una Bézier cúbica
+    c = io.BytesIO()
+    w = c.write
+    color = "{:.3f} {:.3f} {:.3f}".format
+    w(f"1 1 1 rg 0 0 {ANCHO} {ALTO} re f\n".encode())
+    w(f"{color(*COLOR_ARISTA)} RG {color(*COLOR_ARISTA)} rg 1 w\n".encode())
+    estado = "aristas"
+    for p in primitivas:
+        tipo = p[0]
+        if tipo == "circulo" and estado != "nodos":
+            w(f"{color(*COLOR_NODO)} rg 0 0 0 RG 0.5 w\n".encode())
+            estado = "nodos"
+        elif tipo == "texto" and estado != "texto":
+            w(f"{color(*COLOR_TEXTO)} rg\n".encode())
+            estado = "texto"
+
+        # el PDF tiene y hacia arriba
+        if tipo == "linea":
+            w(f"{p[1]:.2f} {ALTO - p[2]:.2f} m {p[3]:.2f} {ALTO - p[4]:.2f} l S\n".encode())
+        elif tipo == "curva":
+            _, x1, y1, qx, qy, x2, y2 = p
+            c1x, c1y = x1 + 2.0 / 3.0 * (qx - x1), y1 + 2.0 / 3.0 * (qy - y1)
+            c2x, c2y = x2 + 2.0 / 3.0 * (qx - x2), y2 + 2.0 / 3.0 * (qy - y2)
+            w(f"{x1:.2f} {ALTO - y1:.2f} m {c1x:.2f} {ALTO - c1y:.2f} {c2x:.2f} {ALTO - c2y:.2f} "
+              f"{x2:.2f} {ALTO - y2:.2f} c S\n".encode())
+        elif tipo == "flecha":
+            (ax, ay), (bx, by), (cx, cy) = p[1]
+            w(f"{ax:.2f} {ALTO - ay:.2f} m {bx:.2f} {ALTO - by:.2f} l {cx:.2f} {ALTO - cy:.2f} l f\n".encode())
+        elif tipo == "circulo":
+            _, x, y, r = p
+            y = ALTO - y
+            kr = k * r
+            w((f"{x + r:.2f} {y:.2f} m "
+               f"{x + r:.2f} {y + kr:.2f} {x + kr:.2f} {y + r:.2f} {x:.2f} {y + r:.2f} c "
+               f"{x - kr:.2f} {y + r:.2f} {x - r:.2f} {y + kr:.2f} {x - r:.2f} {y:.2f} c "
+               f"{x - r:.2f} {y - kr:.2f} {x - kr:.2f} {y - r:.2f} {x:.2f} {y - r:.2f} c "
+               f"{x + kr:.2f} {y - r:.2f} {x + r:.2f} {y - kr:.2f} {x + r:.2f} {y:.2f} c B\n").encode())
+        else:
+            _, x, y, tam, txt = p
+            # centrado aproximado (Helvetica ~0.5 em por carácter)
+            w(f"BT /F1 {tam} Tf {x - 0.25 * tam * len(txt):.2f} {ALTO - y - 0.35 * tam:.2f} Td (".encode())
+            w(_escapar_pdf(txt))
+            w(b") Tj ET\n")
+
+    contenido = zlib.compress(c.getvalue())
+    objetos = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {ANCHO} {ALTO}] "
+         f"/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>").encode(),
+        f"<< /Length {len(contenido)} /Filter /FlateDecode >>\nstream\n".encode() + contenido + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        pos = []
+        for i, obj in enumerate(objetos, start=1):
+            pos.append(f.tell())
+            f.write(f"{i} 0 obj\n".encode() + obj + b"\nendobj\n")
+        xref = f.tell()
+        f.write(f"xref\n0 {len(objetos) + 1}\n0000000000 65535 f \n".encode())
+        for p in pos:
+            f.write(f"{p:010d} 00000 n \n".encode())
+        f.write(f"trailer\n<< /Size {len(objetos) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+
+
+# ----------------------------------------------------------------------
+# Lote
+# ----------------------------------------------------------------------
+# (ruta .gv, ruta de salida sin extensión, categoría: "generados" / "dijkstra")
+Trabajo = Tuple[str, str, str]
+
+
+def trabajos(gv_root: Optional[Path] = None, img_root: Optional[Path] = None) -> List[Trabajo]:
+    """Todos los .gv de gv/{generados,dijkstra}/<modelo>/ con su destino en img/."""
+    gv_root = gv_root or ROOT / "outputs" / "gv"
+    img_root = img_root or ROOT / "outputs" / "img"
+    res = []
+    for tipo in ("generados", "dijkstra"):
+        base = gv_root / tipo
+        if not base.is_dir():
+            continue
+        for gv in sorted(base.glob("*/*.gv")):
+            modelo = gv.parent.name
+            res.append((str(gv), str(img_root / tipo / modelo / gv.stem), tipo))
+    return res
+
+
+def renderizar(trabajo: Trabajo, formatos: Sequence[str] = FORMATOS,
+               iteraciones: Tuple[int, int] = (FA2_ITERS_1, FA2_ITERS_2)) -> List[str]:
+    """Layout + dibujo de un .gv. Regresa las rutas escritas."""
+    gv, salida, categoria = trabajo
+    estilo = ESTILOS[categoria]
+    g = import_graphviz(gv, compacto=True)
+    x, y, tamanos = layout(g, iteraciones, rango_tamanos=estilo["tamanos"])
+    X, Y, R = _a_lienzo(x, y, tamanos)
+    etiquetas = g.num_nodos <= ETIQUETAS_MAX
+
+    Path(salida).parent.mkdir(parents=True, exist_ok=True)
+    escritos = []
+    for fmt in formatos:
+        path = Path(f"{salida}.{fmt}")
+        prims = _primitivas(g, X.tolist(), Y.tolist(), R.tolist(),
+                            etiquetas and estilo["labels_nodos"], etiquetas and estilo["labels_aristas"])
+        if fmt == "svg":
+            escribir_svg(prims, path)
+        elif fmt == "pdf":
+            escribir_pdf(prims, path)
+        else:
+            raise ValueError(f"Formato desconocido: {fmt}")
+        escritos.append(str(path))
+    return escritos
+
+
+def _renderizar_args(args):
+    return renderizar(*args)
+
+
+def huella_render(trabajo: Trabajo, formatos: Sequence[str], iteraciones: Tuple[int, int]) -> str:
+    """Contenido del .gv + parámetros de dibujo + código de esta etapa."""
+    gv, _, categoria = trabajo
+    return huella(
+        "img", hash_archivo(gv), sorted(formatos), list(iteraciones),
+        [ANCHO, ALTO, MARGEN, SEED_LAYOUT, ESCALA_LAYOUT, ESTILOS[categoria], ETIQUETAS_MAX],
+        version_codigo("render_grafos", "layout_fa2", "import_gv_pesos", "grafo_csr"),
+    )
+
+
+def main(workers: Optional[int] = None, formatos: Sequence[str] = FORMATOS,
+         iteraciones: Tuple[int, int] = (FA2_ITERS_1, FA2_ITERS_2), forzar: bool = False):
+    """
+    Un archivo .gv por trabajo en un pool de procesos. Sólo se vuelven a
+    dibujar los .gv cuyo contenido (o parámetros de dibujo) cambió.
+    """
+    manifiesto = Manifiesto(forzar=forzar)
+    pendientes = []
+    for t in trabajos():
+        clave = "img/" + ruta_relativa(t[1])
+        h = huella_render(t, formatos, iteraciones)
+        if manifiesto.al_dia(clave, h):
+            print(f"[=] {t[1]} (sin cambios)")
+        else:
+            pendientes.append((clave, h, (t, tuple(formatos), tuple(iteraciones))))
+
+    if pendientes:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            for (clave, h, _), paths in zip(pendientes, ex.map(_renderizar_args, [a for _, _, a in pendientes])):
+                manifiesto.registrar(clave, h, paths)
+                for p in paths:
+                    print(f"[OK] {p}")
+        manifiesto.guardar()
+
+    print("Listo: imágenes exportadas.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Layout FA2 + SVG/PDF de outputs/gv (sin Gephi).")
+    parser.add_argument("--workers", type=int, default=None, help="procesos (default: núcleos)")
+    parser.add_argument("--formatos", nargs="+", default=list(FORMATOS), choices=FORMATOS)
+    parser.add_argument("--iteraciones", nargs=2, type=int, default=[FA2_ITERS_1, FA2_ITERS_2],
+                        metavar=("SIN_OVERLAP", "CON_OVERLAP"), help="iteraciones de cada fase de FA2")
+    parser.add_argument("--forzar", action="store_true", help="ignora el manifiesto y vuelve a dibujar todo")
+    args = parser.parse_args()
+    main(workers=args.workers, formatos=args.formatos, iteraciones=args.iteraciones, forzar=args.forzar)
@@ -0,0 +1,59 @@
+# scripts/reporte_ch.py
+from __future__ import annotations
+
+import math
+import random
+import time
+
+from config_p3 import ROOT, MODELOS, TAMANOS
+from contraccion import JerarquiaContraccion
+from pipeline import grafo_pesado
+
+
+N_CONSULTAS = 200
+SEED_CONSULTAS = 999
+
+
+def main():
+    out_dir = ROOT / "outputs" / "ch"
+
+    print(f"{'modelo':<18} {'tag':<7} {'n':>5} {'prep (s)':>9} {'atajos':>7} "
+          f"{'dijkstra (ms)':>14} {'ch (ms)':>8} {'speedup':>8}")
+
+    for modelo in MODELOS:
+        for tag, n, seed_base, seed_w in TAMANOS:
+            g = grafo_pesado(modelo, n, seed_base, seed_w)
+
+            t0 = time.perf_counter()
+            ch = JerarquiaContraccion.construir(g)
+            t_prep = time.perf_counter() - t0
+            ch.guardar(str(out_dir / modelo / f"{modelo}_{tag}_n{n}.ch"))
+
+            ids = [nodo.id for nodo in g.nodos()]
+            rng = random.Random(SEED_CONSULTAS)
+            pares = [(rng.choice(ids), rng.choice(ids)) for _ in range(N_CONSULTAS)]
+
+            t_dij = 0.0
+            t_ch = 0.0
+            for s, t in pares:
+                t0 = time.perf_counter()
+                d_ref = g.Dijkstra(s).dist[t]
+                t_dij += time.perf_counter() - t0
+
+                t0 = time.perf_counter()
+                d_ch, _ = ch.shortest_path(s, t)
+                t_ch += time.perf_counter() - t0
+
+                if not (math.isinf(d_ref) and math.isinf(d_ch)) and abs(d_ref - d_ch) > 1e-9:
+                    raise AssertionError(f"{modelo}/{tag}: CH({s},{t})={d_ch} != Dijkstra={d_ref}")
+
+            ms_dij = 1000 * t_dij / N_CONSULTAS
+            ms_ch = 1000 * t_ch / N_CONSULTAS
+            print(f"{modelo:<18} {tag:<7} {len(ids):>5} {t_prep:>9.3f} {ch.num_atajos:>7} "
+                  f"{ms_dij:>14.3f} {ms_ch:>8.3f} {ms_dij / ms_ch:>7.1f}x")
+
+    print("Listo: jerarquías de contracción exportadas y comparadas con Dijkstra.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# scripts/resultado_spt.py
+from __future__ import annotations
+
+import colorsys
+import math
+from typing import Any, Dict, List, Optional
+
+from src.grafo import Grafo
+
+
+class ResultadoSPT:
+    """
+    Resultado ligero de Dijkstra(s): sólo guarda dist y parent.
+    - distance(v) / path_to(v): consultas baratas sobre el árbol
+    - as_grafo(): construye (bajo demanda) el árbol SPT como Grafo (P1)
+      con nodos renombrados "id (dist)"
+
+    Por compatibilidad se puede desempacar como antes:
+        T, dist = g.Dijkstra(s)
+    (eso sí construye el Grafo).
+    """
+
+    __slots__ = ("grafo", "s", "dist", "parent", "stats", "_T")
+
+    def __init__(self, grafo, s, dist: Dict[Any, float], parent: Dict[Any, Any], stats=None):
+        self.grafo = grafo  # grafo original (para coordenadas en as_grafo)
+        self.s = s
+        self.dist = dist
+        self.parent = parent
+        self.stats = stats  # EstadisticasDijkstra si la corrida fue instrumentada
+        self._T: Optional[Grafo] = None
+
+    def distance(self, v) -> float:
+        if v not in self.dist:
+            raise KeyError(f"El nodo {v} no existe en el grafo")
+        return self.dist[v]
+
+    def path_to(self, v) -> List[Any]:
+        """Camino s -> v como lista de ids ([] si v no es alcanzable)."""
+        if math.isinf(self.distance(v)):
+            return []
+        camino = []
+        parent = self.parent
+        while v is not None:
+            camino.append(v)
+            v = parent[v]
+        camino.reverse()
+        return camino
+
+    def as_grafo(self) -> Grafo:
+        """Árbol dirigido (padre -> hijo) para visualización/exportación."""
+        if self._T is not None:
+            return self._T
+
+        dist = self.dist
+
+        def label(nid):
+            if math.isinf(dist[nid]):
+                return f"{nid} (inf)"
+            return f"{nid} ({dist[nid]:.2f})"
+
+        T = Grafo(dirigido=True)
+        new_id = {nid: label(nid) for nid in dist.keys()}
+
+        # nodos (con mismas coords)
+        for nid, nodo in self.grafo._nodos.items():
+            T.add_nodo(new_id[nid], x=nodo.x, y=nodo.y)
+
+        # aristas del SPT
+        for v_id, u_id in self.parent.items():
+            if u_id is None:
+                continue
+            T.add_arista(new_id[u_id], new_id[v_id])
+
+        self._T = T
+        return T
+
+    def __iter__(self):
+        yield self.as_grafo()
+        yield self.dist
+
+
+class ResultadoVoronoi(ResultadoSPT):
+    """
+    Resultado de Dijkstra multifuente (Voronoi sobre el grafo):
+    - dist[v]: distancia a la fuente más cercana
+    - dueno[v]: esa fuente (None si v no es alcanzable)
+    - parent[v]: padre en el bosque de caminos mínimos (None en las fuentes)
+    - celdas(): fuente -> lista de nodos de su celda
+    - color_fn(): id -> color "#rrggbb" por celda, para export_graphviz
+    as_grafo() arma el bosque (un árbol por fuente); s es la tupla de fuentes.
+    """
+
+    __slots__ = ("dueno",)
+
+    def __init__(self, grafo, fuentes, dist: Dict[Any, float], parent: Dict[Any, Any], dueno: Dict[Any, Any]):
+        super().__init__(grafo, tuple(fuentes), dist, parent)
+        self.dueno = dueno
+
+    @property
+    def fuentes(self):
+        return self.s
+
+    def dueno_de(self, v):
+        if v not in self.dueno:
+            raise KeyError(f"El nodo {v} no existe en el grafo")
+        return self.dueno[v]
+
+    def celdas(self) -> Dict[Any, List[Any]]:
+        res: Dict[Any, List[Any]] = {f: [] for f in self.s}
+        for v, f in self.dueno.items():
+            if f is not None:
+                res[f].append(v)
+        return res
+
+    def color_fn(self):
+        """id -> color de su celda (None si no es alcanzable)."""
+        colores = {f: _color(i) for i, f in enumerate(self.s)}
+        dueno = self.dueno
+
+        def color(nid):
+            f = dueno.get(nid)
+            return None if f is None else colores[f]
+        return color
+
+
+def _color(i: int) -> str:
+    # tonos separados por la razón áurea: colores distintos para cualquier k
+    r, g, b = colorsys.hsv_to_rgb((i * 0.618033988749895) % 1.0, 0.55, 0.95)
+    return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
@@ -0,0 +1,372 @@
+# scripts/servidor_consultas.py
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from array import array
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from config_p3 import MODELOS, TAMANOS  # antes que los demás: pone la biblioteca del P1 en sys.path
+from cache_dijkstra import CacheLRU
+from grafo_csr import GrafoCSR
+
+# Servidor local de consultas de caminos mínimos (JSON por línea).
+# Petición:  {"id": 1, "op": "distance", "s": 0, "t": 7}
+# Respuesta: {"id": 1, "ok": true, "dist": 12.3}
+# ops:
+#   ping
+#   distance  s, t  -> dist (null si t no es alcanzable)
+#   path      s, t  -> dist, path (lista de ids; [] si no es alcanzable)
+#   spt       s     -> nodos: [[id, dist, id_padre], ...]
+#   stats           -> latencias (ms) por op, profundidad de cola, cache
+# Los ids de tupla (Malla) viajan como listas JSON: [0, 1] -> (0, 1).
+# Peticiones concurrentes con la misma fuente comparten un solo Dijkstra;
+# el cálculo corre en un executor (procesos por default) para no bloquear
+# el event loop.
+
+LATENCIAS_MAX = 10000  # últimas latencias guardadas por op
+
+# Grafo compilado del proceso worker (se recibe una sola vez en el initializer)
+_G: Optional[GrafoCSR] = None
+
+
+def _init_worker(g: GrafoCSR):
+    global _G
+    _G = g
+
+
+def _spt_worker(s_i: int) -> Tuple[array, array]:
+    return _G.dijkstra(_G.ids[s_i])
+
+
+def _a_id(x):
+    """JSON -> id original (las listas vuelven a ser tuplas)."""
+    if isinstance(x, list):
+        return tuple(_a_id(v) for v in x)
+    return x
+
+
+def _dist_json(d: float):
+    return None if math.isinf(d) else d
+
+
+def _percentiles(valores) -> Dict[str, float]:
+    if not valores:
+        return {"n": 0}
+    v = sorted(valores)
+
+    def p(q):
+        return round(v[min(len(v) - 1, int(q * len(v)))] * 1000.0, 3)
+    return {"n": len(v), "p50": p(0.50), "p90": p(0.90), "p99": p(0.99), "max": round(v[-1] * 1000.0, 3)}
+
+
+class ServidorConsultas:
+    """
+    Sirve consultas sobre un GrafoDijkstra (se compila una vez) o un GrafoCSR.
+    - workers: procesos del executor (None -> núcleos)
+    - hilos=True: executor de un hilo en el mismo proceso (sin copiar el grafo)
+    - max_spt: árboles recientes que se guardan (CacheLRU por fuente)
+    """
+
+    def __init__(self, g, workers: Optional[int] = None, hilos: bool = False, max_spt: int = 64):
+        self.csr = g if isinstance(g, GrafoCSR) else g.compile()
+        if hilos:
+            _init_worker(self.csr)
+            self._executor: Executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            self._executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self.csr,))
+        n = self.csr.num_nodos
+        self._spt = CacheLRU(max_entradas=max_spt, tamano=lambda r: 16 * n)
+        self._en_vuelo: Dict[int, asyncio.Future] = {}
+
+        self._latencias: Dict[str, deque] = {}
+        self.pendientes = 0
+        self.pendientes_max = 0
+        self.calculos = 0
+        self.coalescidas = 0
+        self._servidor: Optional[asyncio.AbstractServer] = None
+        self._conexiones: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    # ------------------------------------------------------------------
+    # Cálculo (coalescido por fuente)
+    # ------------------------------------------------------------------
+    async def _arbol(self, s) -> Tuple[array, array]:
+        s_i = self.csr.indice_de(s)
+        res = self._spt.get(s_i)
+        if res is not None:
+            return res
+
+        fut = self._en_vuelo.get(s_i)
+        if fut is not None:
+            self.coalescidas += 1
+            return await asyncio.shield(fut)
+
+        loop = asyncio.get_running_loop()
+        fut = loop.run_in_executor(self._executor, _spt_worker, s_i)
+        self._en_vuelo[s_i] = fut
+        self.calculos += 1
+        try:
+            res = await asyncio.shield(fut)
+        finally:
+            del self._en_vuelo[s_i]
+        self._spt.put(s_i, res)
+        return res
+
+    # ------------------------------------------------------------------
+    # Operaciones
+    # ------------------------------------------------------------------
+    async def _distance(self, req) -> Dict[str, Any]:
+        dist, _ = await self._arbol(_a_id(req["s"]))
+        return {"dist": _dist_json(dist[self.csr.indice_de(_a_id(req["t"]))])}
+
+    async def _path(self, req) -> Dict[str, Any]:
+        dist, parent = await self._arbol(_a_id(req["s"]))
+        t_i = self.csr.indice_de(_a_id(req["t"]))
+        d = dist[t_i]
+        if math.isinf(d):
+            return {"dist": None, "path": []}
+        return {"dist": d, "path": self.csr._camino(parent, t_i)}
+
+    async def _spt_op(self, req) -> Dict[str, Any]:
+        dist, parent = await self._arbol(_a_id(req["s"]))
+        ids = self.csr.ids
+        return {"nodos": [
+            [ids[i], _dist_json(dist[i]), None if parent[i] < 0 else ids[parent[i]]]
+            for i in range(len(ids))
+        ]}
+
+    def estadisticas(self) -> Dict[str, Any]:
+        cache = self._spt.estadisticas()
+        return {
+            "latencias_ms": {op: _percentiles(v) for op, v in self._latencias.items()},
+            "pendientes": self.pendientes,
+            "pendientes_max": self.pendientes_max,
+            "calculos_en_vuelo": len(self._en_vuelo),
+            "calculos": self.calculos,
+            "coalescidas": self.coalescidas,
+            "cache_hits": cache["hits"],
+            "cache_misses": cache["misses"],
+        }
+
+    async def atender(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        """Una petición ya decodificada -> respuesta (con el mismo id)."""
+        t0 = time.perf_counter()
+        op = req.get("op")
+        self.pendientes += 1
+        self.pendientes_max = max(self.pendientes_max, self.pendientes)
+        try:
+            if op == "ping":
+                cuerpo: Dict[str, Any] = {}
+            elif op == "distance":
+                cuerpo = await self._distance(req)
+            elif op == "path":
+                cuerpo = await self._path(req)
+            elif op == "spt":
+                cuerpo = await self._spt_op(req)
+            elif op == "stats":
+                cuerpo = self.estadisticas()
+            else:
+                raise ValueError(f"op desconocida: {op}")
+            resp = {"id": req.get("id"), "ok": True, **cuerpo}
+        except KeyError as e:
+            resp = {"id": req.get("id"), "ok": False, "error": f"nodo o campo inexistente: {e}"}
+        except (ValueError, TypeError) as e:
+            resp = {"id": req.get("id"), "ok": False, "error": str(e)}
+        except Exception as e:
+            # p. ej. BrokenProcessPool o un error dentro del worker: el cliente
+            # siempre recibe una línea de respuesta en vez de quedarse esperando
+            resp = {"id": req.get("id"), "ok": False, "error": f"error interno: {type(e).__name__}: {e}"}
+        finally:
+            self.pendientes -= 1
+        if op in ("ping", "distance", "path", "spt", "stats"):
+            self._latencias.setdefault(op, deque(maxlen=LATENCIAS_MAX)).append(time.perf_counter() - t0)
+        return resp
+
+    # ------------------------------------------------------------------
+    # Red
+    # ------------------------------------------------------------------
+    async def _conexion(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._conexiones[writer] = asyncio.current_task()
+        tareas = set()
+
+        async def responder(linea: bytes):
+            try:
+                req = json.loads(linea)
+                if not isinstance(req, dict):
+                    raise ValueError("se esperaba un objeto JSON")
+            except ValueError as e:
+                resp = {"id": None, "ok": False, "error": f"JSON inválido: {e}"}
+            else:
+                resp = await self.atender(req)
+            # cada respuesta es una sola línea: no se intercalan
+            writer.write(json.dumps(resp).encode("utf-8") + b"\n")
+            await writer.drain()
+
+        try:
+            while True:
+                linea = await reader.readline()
+                if not linea:
+                    break
+                if not linea.strip():
+                    continue
+                t = asyncio.create_task(responder(linea))
+                tareas.add(t)
+                t.add_done_callback(tareas.discard)
+            if tareas:
+                await asyncio.gather(*tareas, return_exceptions=True)
+        finally:
+            self._conexiones.pop(writer, None)
+            writer.close()
+
+    async def iniciar(self, host: str = "127.0.0.1", puerto: int = 8765, unix: Optional[str] = None):
+        """Abre el socket (TCP local o Unix) y regresa el asyncio.Server."""
+        if unix is not None:
+            self._servidor = await asyncio.start_unix_server(self._conexion, path=unix)
+        else:
+            self._servidor = await asyncio.start_server(self._conexion, host=host, port=puerto)
+        return self._servidor
+
+    async def servir(self, host: str = "127.0.0.1", puerto: int = 8765, unix: Optional[str] = None):
+        servidor = await self.iniciar(host, puerto, unix)
+        async with servidor:
+            await servidor.serve_forever()
+
+    async def cerrar(self):
+        if self._servidor is not None:
+            self._servidor.close()
+        # close() no corta las conexiones abiertas: se cierran aquí para que
+        # cada handler vea EOF y termine normalmente
+        conexiones = list(self._conexiones.items())
+        for writer, _ in conexiones:
+            writer.transport.abort()
+        await asyncio.gather(*(t for _, t in conexiones), return_exceptions=True)
+        if self._servidor is not None:
+            await self._servidor.wait_closed()
+        self._executor.shutdown(wait=True)
+
+
+class ClienteConsultas:
+    """
+    Cliente local: varias consultas concurrentes sobre una sola conexión
+    (las respuestas se emparejan por id).
+        c = await ClienteConsultas.conectar(puerto=8765)
+        d = await c.consultar("distance", s=0, t=7)
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self._siguiente = 0
+        self._esperando: Dict[int, asyncio.Future] = {}
+        self._lector = asyncio.create_task(self._leer())
+
+    @classmethod
+    async def conectar(cls, host: str = "127.0.0.1", puerto: int = 8765, unix: Optional[str] = None):
+        if unix is not None:
+            reader, writer = await asyncio.open_unix_connection(unix)
+        else:
+            reader, writer = await asyncio.open_connection(host, puerto)
+        return cls(reader, writer)
+
+    async def _leer(self):
+        try:
+            while True:
+                linea = await self._reader.readline()
+                if not linea:
+                    break
+                resp = json.loads(linea)
+                fut = self._esperando.pop(resp.get("id"), None)
+                if fut is not None and not fut.done():
+                    fut.set_result(resp)
+        finally:
+            for fut in self._esperando.values():
+                if not fut.done():
+                    fut.set_exception(ConnectionError("conexión cerrada"))
+            self._esperando.clear()
+
+    async def consultar(self, op: str, **campos) -> Dict[str, Any]:
+        if self._lector.done():
+            raise ConnectionError("conexión cerrada")
+        self._siguiente += 1
+        rid = self._siguiente
+        fut = asyncio.get_running_loop().create_future()
+        self._esperando[rid] = fut
+        self._writer.write(json.dumps({"id": rid, "op": op, **campos}).encode("utf-8") + b"\n")
+        await self._writer.drain()
+        return await fut
+
+    async def cerrar(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._lector.cancel()
+
+
+# ----------------------------------------------------------------------
+# CLI
+# ----------------------------------------------------------------------
+def _cargar(args):
+    if args.gv:
+        from import_gv_pesos import import_graphviz
+        return import_graphviz(args.gv, compacto=True)
+    if args.gdb:
+        from formato_binario import load_binary
+        return load_binary(args.gdb)
+
+    from pipeline import grafo_pesado
+    for tag, n, seed_base, seed_w in TAMANOS:
+        if tag == args.tamano:
+            return grafo_pesado(args.modelo, n, seed_base, seed_w)
+    raise ValueError(f"Tamaño desconocido: {args.tamano}")
+
+
+async def _cli_consultar(args):
+    c = await ClienteConsultas.conectar(args.host, args.puerto, args.unix)
+    try:
+        resps = await asyncio.gather(*(c.consultar(**json.loads(q)) for q in args.consultas))
+        for r in resps:
+            print(json.dumps(r, ensure_ascii=False))
+    finally:
+        await c.cerrar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local de consultas Dijkstra (JSON por línea).")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    for nombre in ("servir", "consultar"):
+        p = sub.add_parser(nombre)
+        p.add_argument("--host", default="127.0.0.1")
+        p.add_argument("--puerto", type=int, default=8765)
+        p.add_argument("--unix", default=None, help="ruta de socket Unix (en vez de TCP)")
+
+    ps = sub.choices["servir"]
+    ps.add_argument("--gv", help="grafo .gv (export_graphviz)")
+    ps.add_argument("--gdb", help="grafo binario .gdb (save_binary)")
+    ps.add_argument("--modelo", default="ErdosRenyi", choices=MODELOS, help="si no hay --gv/--gdb: modelo de config_p3")
+    ps.add_argument("--tamano", default="muchos", choices=[t[0] for t in TAMANOS])
+    ps.add_argument("--workers", type=int, default=None, help="procesos del executor (default: núcleos)")
+    ps.add_argument("--hilos", action="store_true", help="executor de un hilo en el mismo proceso")
+
+    pc = sub.choices["consultar"]
+    pc.add_argument("consultas", nargs="+", help='p. ej. \'{"op": "distance", "s": 0, "t": 7}\'')
+
+    args = parser.parse_args()
+    if args.cmd == "consultar":
+        asyncio.run(_cli_consultar(args))
+        return
+
+    servidor = ServidorConsultas(_cargar(args), workers=args.workers, hilos=args.hilos)
+    donde = args.unix or f"{args.host}:{args.puerto}"
+    print(f"Sirviendo {servidor.csr.num_nodos} nodos en {donde}")
+    try:
+        asyncio.run(servidor.servir(args.host, args.puerto, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# scripts/spt_dinamico.py
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Any, Dict, Iterable, Set, Tuple
+
+from resultado_spt import ResultadoSPT
+
+
+class SPTDinamico:
+    """
+    Árbol de caminos más cortos desde s que se repara tras cambios de peso
+    o aristas nuevas (estilo Ramalingam–Reps), sin rehacer Dijkstra(s).
+    - Incremento en una arista del árbol: se invalida el subárbol afectado
+      y se recalcula sólo ese subárbol desde su frontera no afectada.
+    - Decremento / arista nueva: se propaga la mejora desde el extremo.
+    Los cambios se aplican en lote con actualizar().
+    """
+
+    def __init__(self, g, s):
+        self.g = g
+        self.s = s
+        res = g.Dijkstra(s)
+        # copias: con activar_cache() res es compartido y actualizar() muta estos dicts
+        self.dist: Dict[Any, float] = dict(res.dist)
+        self.parent: Dict[Any, Any] = dict(res.parent)
+        self.ultimos_afectados = 0  # nodos re-etiquetados en la última actualización
+
+        # predecesores (sólo hacen falta en grafos dirigidos)
+        self._pred: Dict[Any, Set[Any]] = {}
+        if g.dirigido:
+            for a in g.aristas():
+                self._pred.setdefault(a.destino.id, set()).add(a.origen.id)
+
+    def _entrantes(self, x) -> Iterable[Any]:
+        if self.g.dirigido:
+            return self._pred.get(x, ())
+        return (v.id for v in self.g.vecinos(x))
+
+    def _existe(self, u_id, v_id) -> bool:
+        g = self.g
+        if u_id not in g._nodos or v_id not in g._nodos:
+            return False
+        return g._key_arista(g.get_nodo(u_id), g.get_nodo(v_id)) in g._aristas_key
+
+    def _subarbol(self, raiz) -> Set[Any]:
+        """Nodos del SPT que cuelgan de raiz (incluida)."""
+        parent = self.parent
+        res = {raiz}
+        pila = [raiz]
+        while pila:
+            x = pila.pop()
+            for y in self.g.vecinos(x):
+                y_id = y.id
+                if parent.get(y_id) == x and y_id not in res:
+                    res.add(y_id)
+                    pila.append(y_id)
+        return res
+
+    def actualizar(self, cambios: Iterable[Tuple[Any, Any, float]]):
+        """
+        Aplica al grafo y repara el árbol para un lote de cambios (u, v, peso):
+        - si la arista existe: set_peso(u, v, peso)
+        - si no: add_arista(u, v, peso)
+        """
+        g = self.g
+        dist, parent = self.dist, self.parent
+
+        raices = []  # raíces de subárboles invalidados por incrementos
+        semillas = []  # arcos (u, v) cuyo peso bajó o que son nuevos
+
+        for u, v, peso in cambios:
+            if self._existe(u, v):
+                anterior = g.peso_arista(u, v)
+                g.set_peso(u, v, peso)
+            else:
+                anterior = math.inf
+                g.add_arista(u, v, peso=peso)
+                if g.dirigido:
+                    self._pred.setdefault(v, set()).add(u)
+            for nid in (u, v):
+                if nid not in dist:
+                    dist[nid] = math.inf
+                    parent[nid] = None
+
+            arcos = [(u, v)] if g.dirigido else [(u, v), (v, u)]
+            for a, b in arcos:
+                if peso > anterior and parent[b] == a:
+                    raices.append(b)
+                elif peso < anterior:
+                    semillas.append((a, b))
+
+        heap = []
+        afectados: Set[Any] = set()
+
+        # 1) incrementos: invalida subárboles y los re-siembra desde afuera
+        for r in raices:
+            if r not in afectados:
+                afectados |= self._subarbol(r)
+        for x in afectados:
+            dist[x] = math.inf
+            parent[x] = None
+        for x in afectados:
+            for y in self._entrantes(x):
+                if y in afectados:
+                    continue
+                nd = dist[y] + g.peso_arista(y, x)
+                if nd < dist[x]:
+                    dist[x] = nd
+                    parent[x] = y
+            if not math.isinf(dist[x]):
+                heapq.heappush(heap, (dist[x], x))
+
+        # 2) decrementos / aristas nuevas
+        for a, b in semillas:
+            nd = dist[a] + g.peso_arista(a, b)
+            if nd < dist[b]:
+                dist[b] = nd
+                parent[b] = a
+                heapq.heappush(heap, (nd, b))
+
+        # 3) propagación tipo Dijkstra sólo sobre lo que cambió
+        tocados = set(afectados)
+        while heap:
+            d_u, u_id = heapq.heappop(heap)
+            if d_u > dist[u_id]:
+                continue
+            tocados.add(u_id)
+            for v in g.vecinos(u_id):
+                v_id = v.id
+                nd = d_u + g.peso_arista(u_id, v_id)
+                if nd < dist[v_id]:
+                    dist[v_id] = nd
+                    parent[v_id] = u_id
+                    heapq.heappush(heap, (nd, v_id))
+
+        self.ultimos_afectados = len(tocados)
+
+    def resultado(self) -> ResultadoSPT:
+        """
+        ResultadoSPT sobre el estado actual. Comparte dist/parent con este
+        objeto: una actualización posterior también lo modifica.
+        """
+        return ResultadoSPT(self.g, self.s, self.dist, self.parent)
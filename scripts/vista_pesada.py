@@ -0,0 +1,115 @@
+# scripts/vista_pesada.py
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, Tuple
+
+from src.grafo import Grafo
+from grafo_dijkstra import dijkstra_heap, dijkstra_multifuente
+
+
+class VistaPesada:
+    """
+    Vista con pesos sobre un Grafo (P1) existente, sin copiarlo:
+    - Nodos y adyacencia se leen del grafo base (no se duplican)
+    - Los pesos viven en un dict aparte (por key de arista del base)
+    - Dijkstra(s) corre directo sobre la vista
+    Es para uso de sólo lectura del base: si el base gana o pierde nodos
+    o aristas después de crear la vista, cualquier consulta lanza
+    RuntimeError (hay que crear una vista nueva).
+    """
+
+    def __init__(self, base: Grafo, peso_default: float = 1.0):
+        if peso_default <= 0:
+            raise ValueError("Dijkstra requiere pesos positivos (>0)")
+        self.base = base
+        self.dirigido = base.dirigido
+        self.peso_default = float(peso_default)
+        self._w: Dict[Tuple[Any, Any], float] = {}  # key_arista -> peso
+        self._huella = self._calcular_huella()
+
+    def _calcular_huella(self) -> Tuple[int, int]:
+        return len(self.base._nodos), len(self.base._aristas_key)
+
+    def _verificar(self):
+        if self._calcular_huella() != self._huella:
+            raise RuntimeError("El grafo base cambió desde que se creó la vista")
+
+    # ------------------------------------------------------------------
+    # Lectura (delegada al base)
+    # ------------------------------------------------------------------
+    @property
+    def _nodos(self):
+        return self.base._nodos
+
+    def nodos(self):
+        self._verificar()
+        return self.base.nodos()
+
+    def aristas(self):
+        self._verificar()
+        return self.base.aristas()
+
+    def vecinos(self, nid):
+        return self.base.vecinos(nid)
+
+    def get_nodo(self, nid):
+        return self.base.get_nodo(nid)
+
+    # ------------------------------------------------------------------
+    # Pesos
+    # ------------------------------------------------------------------
+    def _key(self, u_id, v_id):
+        base = self.base
+        return base._key_arista(base.get_nodo(u_id), base.get_nodo(v_id))
+
+    def peso_arista(self, u_id, v_id) -> float:
+        return self._w.get(self._key(u_id, v_id), self.peso_default)
+
+    def set_peso(self, u_id, v_id, peso: float):
+        if peso <= 0:
+            raise ValueError("Dijkstra requiere pesos positivos (>0)")
+        k = self._key(u_id, v_id)
+        if k not in self.base._aristas_key:
+            raise KeyError(f"No existe arista entre {u_id} y {v_id}")
+        self._w[k] = float(peso)
+
+    def asignar_pesos_uniformes(self, w_min: float, w_max: float, seed: int):
+        """Mismos pesos que GrafoDijkstra.asignar_pesos_uniformes con la misma seed."""
+        self._verificar()
+        rng = random.Random(seed)
+        key = self.base._key_arista
+        for a in self.base.aristas():
+            self._w[key(a.origen, a.destino)] = float(rng.uniform(w_min, w_max))
+
+    def asignar_pesos(self, pesos):
+        """Pesos en bloque alineados con aristas() (ver GrafoDijkstra.asignar_pesos)."""
+        aristas = self.aristas()
+        pesos = [float(w) for w in pesos]
+        if len(pesos) != len(aristas):
+            raise ValueError(f"Se esperaban {len(aristas)} pesos, llegaron {len(pesos)}")
+        if pesos and min(pesos) <= 0:
+            raise ValueError("Dijkstra requiere pesos positivos (>0)")
+        key = self.base._key_arista
+        self._w.update(zip((key(a.origen, a.destino) for a in aristas), pesos))
+
+    # ------------------------------------------------------------------
+    # Dijkstra
+    # ------------------------------------------------------------------
+    def Dijkstra(self, s):
+        """Igual que GrafoDijkstra.Dijkstra(s) (heap), sobre la vista."""
+        self._verificar()
+        if s not in self.base._nodos:
+            raise KeyError(f"El nodo fuente {s} no existe en el grafo")
+        return dijkstra_heap(self, s)
+
+    def DijkstraMultifuente(self, fuentes):
+        """Igual que GrafoDijkstra.DijkstraMultifuente(fuentes), sobre la vista."""
+        self._verificar()
+        fuentes = list(dict.fromkeys(fuentes))
+        if not fuentes:
+            raise ValueError("Se requiere al menos una fuente")
+        for f in fuentes:
+            if f not in self.base._nodos:
+                raise KeyError(f"El nodo fuente {f} no existe en el grafo")
+        return dijkstra_multifuente(self, fuentes)
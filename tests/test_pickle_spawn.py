@@ -0,0 +1,80 @@
+# tests/test_pickle_spawn.py
+import multiprocessing
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from formato_binario import load_binary  # noqa: E402
+from grafo_csr import GrafoCSR  # noqa: E402
+import matriz_distancias as md  # noqa: E402
+
+
+def _malla(k: int) -> GrafoCSR:
+    ids = [(i, j) for i in range(k) for j in range(k)]
+    aristas = []
+    for i in range(k):
+        for j in range(k):
+            u = i * k + j
+            if j + 1 < k:
+                aristas.append((u, u + 1, 1.0 + (u % 3)))
+            if i + 1 < k:
+                aristas.append((u, u + k, 2.0 + (u % 5)))
+    xs = [float(i) for i, _ in ids]
+    ys = [float(j) for _, j in ids]
+    return GrafoCSR.from_aristas(ids, aristas, xs, ys)
+
+
+def _mismos_buffers(a: GrafoCSR, b: GrafoCSR) -> bool:
+    return (
+        list(a.ids) == list(b.ids)
+        and a.dirigido == b.dirigido
+        and all(
+            # por bytes: xs/ys pueden ser NaN
+            np.asarray(getattr(a, c)).tobytes() == np.asarray(getattr(b, c)).tobytes()
+            for c in ("offsets", "destinos", "pesos", "xs", "ys")
+        )
+    )
+
+
+def _distancias_spawn(g: GrafoCSR, fuentes) -> np.ndarray:
+    # mismo initializer que matriz_distancias, pero forzando spawn
+    # (default en Windows/macOS): el grafo viaja serializado al worker
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=2, mp_context=ctx, initializer=md._init_worker, initargs=(g,)) as ex:
+        D, _ = ex.submit(md._tarea, (fuentes, None, False)).result()
+    return D
+
+
+def test_pickle_grafo_cargado(tmp_path):
+    g = _malla(6)
+    p = tmp_path / "malla.gdb"
+    g.save_binary(str(p))
+    for mmap in (True, False):
+        h = load_binary(str(p), mmap=mmap)
+        assert _mismos_buffers(pickle.loads(pickle.dumps(h)), g)
+
+
+def test_matriz_distancias_spawn_con_gdb(tmp_path):
+    g = _malla(6)
+    p = tmp_path / "malla.gdb"
+    g.save_binary(str(p))
+    h = load_binary(str(p))
+    fuentes = list(range(0, g.num_nodos, 5))
+    esperado = md.matriz_distancias(g, [g.ids[i] for i in fuentes], workers=1)
+    assert np.array_equal(_distancias_spawn(h, fuentes), esperado)
+
+
+def test_matriz_distancias_spawn_con_generador_compacto():
+    # generadores_rapidos necesita config_p3 (y éste la biblioteca del P1)
+    gr = pytest.importorskip("generadores_rapidos")
+    g = gr.generar_compacto("ErdosRenyi", 2000, 1, seed_pesos=2)
+    assert _mismos_buffers(pickle.loads(pickle.dumps(g)), g)
+    fuentes = list(range(0, g.num_nodos, 250))
+    esperado = md.matriz_distancias(g, [g.ids[i] for i in fuentes], workers=1)
+    assert np.array_equal(_distancias_spawn(g, fuentes), esperado)